@@ -2,20 +2,31 @@
 Vercel serverless function entrypoint for the be-invest API.
 """
 import sys
-import os
+from pathlib import Path
 
-# Add the src directory to Python path for Vercel deployment
-current_dir = os.path.dirname(os.path.abspath(__file__))
-root_dir = os.path.dirname(current_dir)
-src_dir = os.path.join(root_dir, "src")
+# Add the src directory to Python path for Vercel deployment. The deployment
+# layout is fixed, so skip existence checks and avoid stat calls on cold start.
+root_dir = Path(__file__).resolve().parent.parent
+src_dir = root_dir / "src"
+sys.path[:0] = [p for p in (str(src_dir), str(root_dir)) if p not in sys.path]
 
-# Add paths if they exist
-for path in [src_dir, root_dir]:
-    if os.path.exists(path) and path not in sys.path:
-        sys.path.insert(0, path)
+_app = None
+
+
+async def app(scope, receive, send):
+    """ASGI entrypoint that imports the FastAPI app on the first request.
+
+    Importing ``be_invest.api.server`` pulls in FastAPI, pydantic and the whole
+    package, so it is deferred out of module load to keep cold starts short.
+    """
+    global _app
+    if _app is None:
+        server = sys.modules.get("be_invest.api.server")
+        if server is None:
+            from be_invest.api import server
+        _app = server.app
+    await _app(scope, receive, send)
 
-# Import the FastAPI app
-from be_invest.api.server import app
 
 # Vercel expects the ASGI application to be named 'app'
 __all__ = ["app"]
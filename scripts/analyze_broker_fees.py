@@ -10,18 +10,19 @@ This script provides the analysis requested by Rudolf:
 from __future__ import annotations
 
 import csv
-import json
+import io
 import sys
 import os
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.be_invest.models import FeeRecord
+from src.be_invest.utils.jsonio import write_json
 from tests.test_data_quality_validation import (
     EXPECTED_BROKER_FEES,
     EXPECTED_CUSTODY_FEES,
@@ -31,10 +32,54 @@ from tests.test_data_quality_validation import (
     validate_fee_structure_type
 )
 
+# Expected fees indexed by broker, built once instead of scanned per lookup
+_ETF_EXPECTED = {e.broker: e for e in EXPECTED_BROKER_FEES["ETF"]}
+_STOCK_EXPECTED = {e.broker: e for e in EXPECTED_BROKER_FEES["Stocks"]}
+
+# Trade sizes reported per broker and the matching BrokerAnalysis fields
+_TRADE_SIZES = (250, 500, 1000, 5000)
+_ETF_COST_ATTRS = ("etf_cost_250", "etf_cost_500", "etf_cost_1000", "etf_cost_5000")
+_STOCK_COST_ATTRS = ("stock_cost_250", "stock_cost_500", "stock_cost_1000", "stock_cost_5000")
+
+# Investor scenario report labels and the BrokerAnalysis field behind each cell
+_INVESTOR_A_LABEL = "Investor A (€169/month for 5 years)"
+_INVESTOR_B_LABEL = "Investor B (€10k lump + €500/month for 5 years)"
+_SCENARIO_LABELS = (_INVESTOR_A_LABEL, _INVESTOR_B_LABEL)
+_SCENARIO_COST_ATTRS = (
+    (_INVESTOR_A_LABEL, "ETF", "investor_a_etf_cost"),
+    (_INVESTOR_A_LABEL, "Stocks", "investor_a_stock_cost"),
+    (_INVESTOR_B_LABEL, "ETF", "investor_b_etf_cost"),
+    (_INVESTOR_B_LABEL, "Stocks", "investor_b_stock_cost"),
+)
+
+# Column order of full_broker_analysis.csv; every column but the last is a
+# plain BrokerAnalysis attribute, the issues column is joined into one cell
+_CSV_FIELDNAMES = (
+    "broker", "etf_fee_structure", "stock_fee_structure",
+    "has_custody_fee", "custody_fee_details",
+    "etf_cost_250", "etf_cost_500", "etf_cost_1000", "etf_cost_5000",
+    "stock_cost_250", "stock_cost_500", "stock_cost_1000", "stock_cost_5000",
+    "investor_a_etf_cost", "investor_a_stock_cost",
+    "investor_b_etf_cost", "investor_b_stock_cost",
+    "data_quality_issues"
+)
+_CSV_VALUE_FIELDS = _CSV_FIELDNAMES[:-1]
+
 
 @dataclass
 class BrokerAnalysis:
     """Analysis results for a broker."""
+    # Declared by hand because dataclass(slots=True) requires Python 3.10
+    __slots__ = (
+        "broker", "etf_fee_structure", "stock_fee_structure",
+        "has_custody_fee", "custody_fee_details",
+        "etf_cost_250", "etf_cost_500", "etf_cost_1000", "etf_cost_5000",
+        "stock_cost_250", "stock_cost_500", "stock_cost_1000", "stock_cost_5000",
+        "investor_a_etf_cost", "investor_a_stock_cost",
+        "investor_b_etf_cost", "investor_b_stock_cost",
+        "data_quality_issues",
+    )
+
     broker: str
     etf_fee_structure: str
     stock_fee_structure: str
@@ -63,11 +108,13 @@ def analyze_broker_fees(fee_records: List[FeeRecord]) -> Dict[str, BrokerAnalysi
     # Group records by broker
     brokers = {}
     for record in fee_records:
-        if record.broker not in brokers:
-            brokers[record.broker] = {"ETFs": [], "Equities": []}
+        # Interned so every report dict keyed by broker shares one string
+        broker = sys.intern(record.broker)
+        if broker not in brokers:
+            brokers[broker] = {"ETFs": [], "Equities": []}
 
-        if record.instrument_type in brokers[record.broker]:
-            brokers[record.broker][record.instrument_type].append(record)
+        if record.instrument_type in brokers[broker]:
+            brokers[broker][record.instrument_type].append(record)
 
     for broker_name, instrument_records in brokers.items():
         etf_records = instrument_records.get("ETFs", [])
@@ -87,17 +134,19 @@ def analyze_broker_fees(fee_records: List[FeeRecord]) -> Dict[str, BrokerAnalysi
         custody_details = custody_info.get("amount", "") if has_custody else "None"
 
         # Calculate costs for different trade sizes
-        trade_sizes = [250, 500, 1000, 5000]
-
         etf_costs = []
         stock_costs = []
 
-        for size in trade_sizes:
+        for size in _TRADE_SIZES:
             etf_cost = calculate_total_cost(primary_etf, size) if primary_etf else 0.0
             stock_cost = calculate_total_cost(primary_stock, size) if primary_stock else 0.0
             etf_costs.append(etf_cost)
             stock_costs.append(stock_cost)
 
+        # Reused by the data quality checks instead of recomputing per size
+        etf_cost_by_size = dict(zip(_TRADE_SIZES, etf_costs))
+        stock_cost_by_size = dict(zip(_TRADE_SIZES, stock_costs))
+
         # Calculate investor scenarios
         investor_a = INVESTOR_SCENARIOS["A"]
         investor_b = INVESTOR_SCENARIOS["B"]
@@ -119,7 +168,10 @@ def analyze_broker_fees(fee_records: List[FeeRecord]) -> Dict[str, BrokerAnalysi
         ) if primary_stock else {"total_cost": 0.0}
 
         # Data quality validation
-        issues = validate_broker_data_quality(broker_name, primary_etf, primary_stock)
+        issues = validate_broker_data_quality(
+            broker_name, primary_etf, primary_stock,
+            etf_costs=etf_cost_by_size, stock_costs=stock_cost_by_size
+        )
 
         analysis = BrokerAnalysis(
             broker=broker_name,
@@ -147,170 +199,207 @@ def analyze_broker_fees(fee_records: List[FeeRecord]) -> Dict[str, BrokerAnalysi
     return broker_analyses
 
 
+def _cached_total_cost(
+    record: FeeRecord,
+    trade_size: float,
+    cost_cache: Optional[Dict[float, float]]
+) -> float:
+    """Return the total cost for a trade size, filling the cache on a miss."""
+    if cost_cache is None:
+        return calculate_total_cost(record, trade_size)
+    cost = cost_cache.get(trade_size)
+    if cost is None:
+        cost = cost_cache[trade_size] = calculate_total_cost(record, trade_size)
+    return cost
+
+
+def _check_bolero(etf_record, stock_record, etf_costs, stock_costs, issues: List[str]) -> None:
+    """Bolero: a €5k trade costs €15, not €10."""
+    if etf_record and _cached_total_cost(etf_record, 5000, etf_costs) != 15.0:
+        issues.append("Bolero ETF 5k trade should cost €15, not €10")
+    if stock_record and _cached_total_cost(stock_record, 5000, stock_costs) != 15.0:
+        issues.append("Bolero stock 5k trade should cost €15, not €10")
+
+
+def _check_degiro(etf_record, stock_record, etf_costs, stock_costs, issues: List[str]) -> None:
+    """Degiro: check for missing handling fee."""
+    if etf_record and (etf_record.base_fee or 0) < 1.0:
+        issues.append("Degiro missing €1 handling fee for ETFs")
+    if stock_record and (stock_record.base_fee or 0) < 1.0:
+        issues.append("Degiro missing €1 handling fee for stocks")
+
+
+def _check_rebel(etf_record, stock_record, etf_costs, stock_costs, issues: List[str]) -> None:
+    """Rebel: Brussels pricing, €3 for stock trades up to €2.5k."""
+    # Check for Brussels vs Paris/Amsterdam confusion
+    if stock_record and stock_record.notes:
+        if "Paris" in stock_record.notes or "Amsterdam" in stock_record.notes:
+            issues.append("Rebel using Paris/Amsterdam data instead of Brussels")
+
+    # Check specific fee for stocks up to 2.5k
+    if stock_record and _cached_total_cost(stock_record, 2500, stock_costs) != 3.0:
+        issues.append("Rebel stock trades up to €2.5k should cost €3")
+
+
+# Broker-specific checks, looked up once per broker instead of an elif chain
+_SPECIAL_CHECKS = {
+    "Bolero": _check_bolero,
+    "Degiro Belgium": _check_degiro,
+    "Degiro": _check_degiro,
+    "Rebel": _check_rebel,
+}
+
+
 def validate_broker_data_quality(
     broker: str,
     etf_record: Optional[FeeRecord],
-    stock_record: Optional[FeeRecord]
+    stock_record: Optional[FeeRecord],
+    etf_costs: Optional[Dict[float, float]] = None,
+    stock_costs: Optional[Dict[float, float]] = None
 ) -> List[str]:
-    """Validate broker data against Rudolf's expected values."""
+    """Validate broker data against Rudolf's expected values.
+
+    ``etf_costs``/``stock_costs`` map trade size to an already computed total
+    cost for the given record; missing sizes are computed and added.
+    """
 
     issues = []
 
     # Check ETF expectations
-    if broker in [e.broker for e in EXPECTED_BROKER_FEES["ETF"]]:
-        expected_etf = next((e for e in EXPECTED_BROKER_FEES["ETF"] if e.broker == broker), None)
-
-        if expected_etf and etf_record:
-            if expected_etf.trade_size_eur and expected_etf.expected_total_cost_eur:
-                actual_cost = calculate_total_cost(etf_record, expected_etf.trade_size_eur)
-                if abs(actual_cost - expected_etf.expected_total_cost_eur) > 0.01:
-                    issues.append(
-                        f"ETF cost mismatch: expected {expected_etf.expected_total_cost_eur}€ "
-                        f"for {expected_etf.trade_size_eur}€ trade, got {actual_cost}€"
-                    )
+    expected_etf = _ETF_EXPECTED.get(broker)
+    if expected_etf and etf_record:
+        if expected_etf.trade_size_eur and expected_etf.expected_total_cost_eur:
+            actual_cost = _cached_total_cost(etf_record, expected_etf.trade_size_eur, etf_costs)
+            if abs(actual_cost - expected_etf.expected_total_cost_eur) > 0.01:
+                issues.append(
+                    f"ETF cost mismatch: expected {expected_etf.expected_total_cost_eur}€ "
+                    f"for {expected_etf.trade_size_eur}€ trade, got {actual_cost}€"
+                )
 
     # Check stock expectations
-    if broker in [e.broker for e in EXPECTED_BROKER_FEES["Stocks"]]:
-        expected_stock = next((e for e in EXPECTED_BROKER_FEES["Stocks"] if e.broker == broker), None)
-
-        if expected_stock and stock_record:
-            if expected_stock.trade_size_eur and expected_stock.expected_total_cost_eur:
-                actual_cost = calculate_total_cost(stock_record, expected_stock.trade_size_eur)
-                if abs(actual_cost - expected_stock.expected_total_cost_eur) > 0.01:
-                    issues.append(
-                        f"Stock cost mismatch: expected {expected_stock.expected_total_cost_eur}€ "
-                        f"for {expected_stock.trade_size_eur}€ trade, got {actual_cost}€"
-                    )
+    expected_stock = _STOCK_EXPECTED.get(broker)
+    if expected_stock and stock_record:
+        if expected_stock.trade_size_eur and expected_stock.expected_total_cost_eur:
+            actual_cost = _cached_total_cost(stock_record, expected_stock.trade_size_eur, stock_costs)
+            if abs(actual_cost - expected_stock.expected_total_cost_eur) > 0.01:
+                issues.append(
+                    f"Stock cost mismatch: expected {expected_stock.expected_total_cost_eur}€ "
+                    f"for {expected_stock.trade_size_eur}€ trade, got {actual_cost}€"
+                )
 
     # Specific broker checks based on Rudolf's feedback
-    if broker == "Bolero":
-        if etf_record and calculate_total_cost(etf_record, 5000) != 15.0:
-            issues.append("Bolero ETF 5k trade should cost €15, not €10")
-        if stock_record and calculate_total_cost(stock_record, 5000) != 15.0:
-            issues.append("Bolero stock 5k trade should cost €15, not €10")
-
-    elif broker in ["Degiro Belgium", "Degiro"]:
-        # Check for missing handling fee
-        if etf_record and (etf_record.base_fee or 0) < 1.0:
-            issues.append("Degiro missing €1 handling fee for ETFs")
-        if stock_record and (stock_record.base_fee or 0) < 1.0:
-            issues.append("Degiro missing €1 handling fee for stocks")
-
-    elif broker == "Rebel":
-        # Check for Brussels vs Paris/Amsterdam confusion
-        if stock_record and stock_record.notes:
-            if "Paris" in stock_record.notes or "Amsterdam" in stock_record.notes:
-                issues.append("Rebel using Paris/Amsterdam data instead of Brussels")
-
-        # Check specific fee for stocks up to 2.5k
-        if stock_record and calculate_total_cost(stock_record, 2500) != 3.0:
-            issues.append("Rebel stock trades up to €2.5k should cost €3")
+    special_check = _SPECIAL_CHECKS.get(broker)
+    if special_check:
+        special_check(etf_record, stock_record, etf_costs, stock_costs, issues)
 
     return issues
 
 
-def find_cheapest_brokers(analyses: Dict[str, BrokerAnalysis]) -> Dict[str, Dict]:
-    """Find cheapest broker for each trade size and instrument type."""
+def _new_size_minima() -> Dict[str, List[Tuple[Optional[str], float]]]:
+    """Return empty running (broker, cost) minima for every trade size."""
+    return {
+        "ETF": [(None, float('inf'))] * len(_TRADE_SIZES),
+        "Stocks": [(None, float('inf'))] * len(_TRADE_SIZES)
+    }
+
+
+def _track_cheapest_by_size(minima: Dict[str, List], broker: str, analysis: BrokerAnalysis) -> None:
+    """Fold one broker's per-size costs into the running minima."""
+    etf_best = minima["ETF"]
+    stock_best = minima["Stocks"]
+    for i, (etf_attr, stock_attr) in enumerate(zip(_ETF_COST_ATTRS, _STOCK_COST_ATTRS)):
+        etf_cost = getattr(analysis, etf_attr)
+        if 0 < etf_cost < etf_best[i][1]:
+            etf_best[i] = (broker, etf_cost)
+
+        stock_cost = getattr(analysis, stock_attr)
+        if 0 < stock_cost < stock_best[i][1]:
+            stock_best[i] = (broker, stock_cost)
 
-    trade_sizes = [250, 500, 1000, 5000]
+
+def _size_minima_to_results(minima: Dict[str, List]) -> Dict[str, Dict]:
+    """Convert running minima into the cheapest-by-trade-size report shape."""
     results = {
         "ETF": {},
         "Stocks": {}
     }
 
-    for size in trade_sizes:
-        # ETF cheapest
-        etf_costs = {
-            broker: getattr(analysis, f"etf_cost_{size}")
-            for broker, analysis in analyses.items()
-            if getattr(analysis, f"etf_cost_{size}") > 0
-        }
+    for instrument, best in minima.items():
+        for size, (broker, cost) in zip(_TRADE_SIZES, best):
+            if broker is not None:
+                results[instrument][size] = {"broker": broker, "cost": cost}
 
-        if etf_costs:
-            cheapest_etf_broker = min(etf_costs.keys(), key=lambda b: etf_costs[b])
-            results["ETF"][size] = {
-                "broker": cheapest_etf_broker,
-                "cost": etf_costs[cheapest_etf_broker]
-            }
-
-        # Stock cheapest
-        stock_costs = {
-            broker: getattr(analysis, f"stock_cost_{size}")
-            for broker, analysis in analyses.items()
-            if getattr(analysis, f"stock_cost_{size}") > 0
-        }
+    return results
+
+
+def find_cheapest_brokers(analyses: Dict[str, BrokerAnalysis]) -> Dict[str, Dict]:
+    """Find cheapest broker for each trade size and instrument type."""
+
+    minima = _new_size_minima()
+    for broker, analysis in analyses.items():
+        _track_cheapest_by_size(minima, broker, analysis)
+
+    return _size_minima_to_results(minima)
 
-        if stock_costs:
-            cheapest_stock_broker = min(stock_costs.keys(), key=lambda b: stock_costs[b])
-            results["Stocks"][size] = {
-                "broker": cheapest_stock_broker,
-                "cost": stock_costs[cheapest_stock_broker]
-            }
 
+def _new_scenario_minima() -> List[Tuple[Optional[str], float]]:
+    """Return empty running (broker, cost) minima, one per scenario cell."""
+    return [(None, float('inf'))] * len(_SCENARIO_COST_ATTRS)
+
+
+def _track_cheapest_for_scenarios(minima: List, broker: str, analysis: BrokerAnalysis) -> None:
+    """Fold one broker's investor scenario costs into the running minima."""
+    for i, (_, _, attr) in enumerate(_SCENARIO_COST_ATTRS):
+        cost = getattr(analysis, attr)
+        if 0 < cost < minima[i][1]:
+            minima[i] = (broker, cost)
+
+
+def _scenario_minima_to_results(minima: List) -> Dict[str, Dict]:
+    """Convert running minima into the cheapest-by-scenario report shape."""
+    results = {scenario: {} for scenario in _SCENARIO_LABELS}
+    for (scenario, instrument, _), (broker, cost) in zip(_SCENARIO_COST_ATTRS, minima):
+        # A cell no broker matched keeps its inf sentinel; report it as null
+        # rather than leaving inf to the JSON writer
+        results[scenario][instrument] = {"broker": broker, "cost": cost if broker is not None else None}
     return results
 
 
 def find_cheapest_for_scenarios(analyses: Dict[str, BrokerAnalysis]) -> Dict[str, Dict]:
     """Find cheapest broker for each investor scenario."""
 
-    results = {
-        "Investor A (€169/month for 5 years)": {
-            "ETF": {"broker": None, "cost": float('inf')},
-            "Stocks": {"broker": None, "cost": float('inf')}
-        },
-        "Investor B (€10k lump + €500/month for 5 years)": {
-            "ETF": {"broker": None, "cost": float('inf')},
-            "Stocks": {"broker": None, "cost": float('inf')}
-        }
-    }
-
+    minima = _new_scenario_minima()
     for broker, analysis in analyses.items():
-        # Investor A
-        if analysis.investor_a_etf_cost > 0 and analysis.investor_a_etf_cost < results["Investor A (€169/month for 5 years)"]["ETF"]["cost"]:
-            results["Investor A (€169/month for 5 years)"]["ETF"] = {
-                "broker": broker,
-                "cost": analysis.investor_a_etf_cost
-            }
-
-        if analysis.investor_a_stock_cost > 0 and analysis.investor_a_stock_cost < results["Investor A (€169/month for 5 years)"]["Stocks"]["cost"]:
-            results["Investor A (€169/month for 5 years)"]["Stocks"] = {
-                "broker": broker,
-                "cost": analysis.investor_a_stock_cost
-            }
-
-        # Investor B
-        if analysis.investor_b_etf_cost > 0 and analysis.investor_b_etf_cost < results["Investor B (€10k lump + €500/month for 5 years)"]["ETF"]["cost"]:
-            results["Investor B (€10k lump + €500/month for 5 years)"]["ETF"] = {
-                "broker": broker,
-                "cost": analysis.investor_b_etf_cost
-            }
-
-        if analysis.investor_b_stock_cost > 0 and analysis.investor_b_stock_cost < results["Investor B (€10k lump + €500/month for 5 years)"]["Stocks"]["cost"]:
-            results["Investor B (€10k lump + €500/month for 5 years)"]["Stocks"] = {
-                "broker": broker,
-                "cost": analysis.investor_b_stock_cost
-            }
+        _track_cheapest_for_scenarios(minima, broker, analysis)
 
-    return results
+    return _scenario_minima_to_results(minima)
 
 
 def generate_analysis_report(analyses: Dict[str, BrokerAnalysis], output_dir: Path):
-    """Generate comprehensive analysis reports."""
+    """Generate comprehensive analysis reports.
+
+    All five outputs are built in a single pass over ``analyses``; the JSON
+    reports are written once the pass is complete.
+    """
 
     output_dir.mkdir(exist_ok=True)
 
-    # 1. Data quality report
     quality_issues = []
+    structure_analysis = {}
+    size_minima = _new_size_minima()
+    scenario_minima = _new_scenario_minima()
+
+    # Buffer the CSV in memory and write it with a single call after the pass
+    csv_buffer = io.StringIO()
+    writer = csv.writer(csv_buffer)
+    writer.writerow(_CSV_FIELDNAMES)
+
     for broker, analysis in analyses.items():
+        # 1. Data quality report
         for issue in analysis.data_quality_issues:
             quality_issues.append({"broker": broker, "issue": issue})
 
-    with open(output_dir / "data_quality_issues.json", "w") as f:
-        json.dump(quality_issues, f, indent=2)
-
-    # 2. Fee structure analysis
-    structure_analysis = {}
-    for broker, analysis in analyses.items():
+        # 2. Fee structure analysis
         structure_analysis[broker] = {
             "ETF_structure": analysis.etf_fee_structure,
             "Stock_structure": analysis.stock_fee_structure,
@@ -318,38 +407,26 @@ def generate_analysis_report(analyses: Dict[str, BrokerAnalysis], output_dir: Pa
             "custody_details": analysis.custody_fee_details
         }
 
-    with open(output_dir / "fee_structure_analysis.json", "w") as f:
-        json.dump(structure_analysis, f, indent=2)
+        # 3. Cheapest broker by trade size
+        _track_cheapest_by_size(size_minima, broker, analysis)
 
-    # 3. Cheapest broker by trade size
-    cheapest_by_size = find_cheapest_brokers(analyses)
-    with open(output_dir / "cheapest_by_trade_size.json", "w") as f:
-        json.dump(cheapest_by_size, f, indent=2)
+        # 4. Cheapest broker by investor scenario
+        _track_cheapest_for_scenarios(scenario_minima, broker, analysis)
 
-    # 4. Cheapest broker by investor scenario
-    cheapest_by_scenario = find_cheapest_for_scenarios(analyses)
-    with open(output_dir / "cheapest_by_scenario.json", "w") as f:
-        json.dump(cheapest_by_scenario, f, indent=2)
+        # 5. Full analysis CSV; read attributes directly since asdict()
+        # would deep-copy every analysis
+        writer.writerow(
+            [getattr(analysis, name) for name in _CSV_VALUE_FIELDS]
+            + ["; ".join(analysis.data_quality_issues)]
+        )
 
-    # 5. Full analysis CSV
     with open(output_dir / "full_broker_analysis.csv", "w", newline="", encoding="utf-8") as f:
-        fieldnames = [
-            "broker", "etf_fee_structure", "stock_fee_structure",
-            "has_custody_fee", "custody_fee_details",
-            "etf_cost_250", "etf_cost_500", "etf_cost_1000", "etf_cost_5000",
-            "stock_cost_250", "stock_cost_500", "stock_cost_1000", "stock_cost_5000",
-            "investor_a_etf_cost", "investor_a_stock_cost",
-            "investor_b_etf_cost", "investor_b_stock_cost",
-            "data_quality_issues"
-        ]
-
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        f.write(csv_buffer.getvalue())
 
-        for broker, analysis in analyses.items():
-            row = asdict(analysis)
-            row["data_quality_issues"] = "; ".join(analysis.data_quality_issues)
-            writer.writerow(row)
+    write_json(quality_issues, output_dir / "data_quality_issues.json")
+    write_json(structure_analysis, output_dir / "fee_structure_analysis.json")
+    write_json(_size_minima_to_results(size_minima), output_dir / "cheapest_by_trade_size.json")
+    write_json(_scenario_minima_to_results(scenario_minima), output_dir / "cheapest_by_scenario.json")
 
     return {
         "quality_issues": len(quality_issues),
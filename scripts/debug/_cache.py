@@ -0,0 +1,61 @@
+"""On-disk HTML cache for the debug scripts.
+
+Selector tweaking means rerunning the same probe many times; caching the
+fetched (or rendered) HTML by URL skips the network and the browser launch on
+reruns. Entries expire after ``ttl`` seconds; pass ``--refresh`` on the
+command line to ignore the cache for one run.
+"""
+from __future__ import annotations
+
+import hashlib
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from _paths import PROJECT_ROOT
+
+CACHE_DIR = PROJECT_ROOT / "data" / "output" / "_htmlcache"
+DEFAULT_TTL_SECONDS = 3600
+REFRESH = "--refresh" in sys.argv
+
+
+def cache_path(url: str) -> Path:
+    """Return the cache file for ``url``."""
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"{key}.html"
+
+
+def read_cached(url: str, ttl: float = DEFAULT_TTL_SECONDS) -> Optional[str]:
+    """Return the cached HTML for ``url`` if it is fresh, else ``None``."""
+    if REFRESH:
+        return None
+    path = cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def write_cached(url: str, html: str) -> None:
+    """Store ``html`` as the cached copy of ``url``."""
+    path = cache_path(url)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(html, encoding="utf-8")
+
+
+def cached_html(url: str, fetcher: Callable[[str], str], ttl: float = DEFAULT_TTL_SECONDS) -> str:
+    """Return the HTML for ``url``, calling ``fetcher`` only on a cache miss.
+
+    Whatever ``fetcher`` returns is cached for ``ttl`` seconds, so it should
+    raise on an error response instead of returning the error page.
+    """
+    html = read_cached(url, ttl)
+    if html is None:
+        html = fetcher(url)
+        write_cached(url, html)
+    else:
+        print(f"(cached HTML for {url}; pass --refresh to refetch)")
+    return html
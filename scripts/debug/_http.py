@@ -0,0 +1,24 @@
+"""Pooled HTTP client for the debug scripts.
+
+A single keep-alive client avoids a fresh TCP + TLS handshake for every
+request to the same host. HTTP/2 is used when the optional ``h2`` package is
+installed (``pip install "httpx[http2]"``), and httpx advertises and decodes
+brotli responses when ``brotli`` is (``pip install "httpx[brotli]"``); gzip
+and deflate are always negotiated.
+"""
+from __future__ import annotations
+
+import atexit
+import importlib.util
+
+import httpx
+
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+CLIENT = httpx.Client(
+    http2=_HTTP2,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=20.0,
+    follow_redirects=True,  # match requests.get()
+)
+atexit.register(CLIENT.close)
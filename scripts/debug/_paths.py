@@ -0,0 +1,15 @@
+"""Repository paths for the debug scripts.
+
+Importing this module puts ``src/`` on ``sys.path`` (once per process) so the
+scripts can import ``be_invest`` without an editable install.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SRC_PATH = PROJECT_ROOT / "src"
+
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
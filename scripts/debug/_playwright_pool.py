@@ -0,0 +1,116 @@
+"""Shared Playwright browser for the debug scripts.
+
+Launching Chromium dominates the runtime of the structure probes, so a single
+browser is launched per process and reused. Each URL gets its own context,
+which is cheap to create and keeps cookies/storage isolated between sites.
+"""
+from __future__ import annotations
+
+import atexit
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Optional
+
+from playwright.async_api import Browser as AsyncBrowser, BrowserContext as AsyncBrowserContext
+from playwright.async_api import Route as AsyncRoute, async_playwright
+from playwright.sync_api import Browser, Page, Playwright, Response, Route, sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+# page.content() also serialises <head> scripts and styles the probes never
+# look at; evaluating this returns just the body. Parse the result with
+# lxml.html.document_fromstring so the <body> element is kept.
+BODY_HTML_JS = "() => document.body.outerHTML"
+
+# The probes only read the DOM, so these requests are refused to shorten loads
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+
+
+def _shutdown() -> None:
+    """Close the shared browser and stop Playwright at interpreter exit."""
+    global _playwright, _browser
+    if _browser is not None:
+        _browser.close()
+        _browser = None
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
+
+@contextmanager
+def shared_browser(headless: bool = True) -> Iterator[Browser]:
+    """Yield the process-wide Chromium browser, launching it on first use."""
+    global _playwright, _browser
+    if _browser is None:
+        _playwright = sync_playwright().start()
+        _browser = _playwright.chromium.launch(headless=headless)
+        atexit.register(_shutdown)
+    yield _browser
+
+
+def _block_static(route: Route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def _block_static_async(route: AsyncRoute) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@contextmanager
+def new_page(browser: Browser) -> Iterator[Page]:
+    """Yield a page in a fresh browser context, closing the context afterwards."""
+    context = browser.new_context()
+    context.route("**/*", _block_static)
+    try:
+        yield context.new_page()
+    finally:
+        context.close()
+
+
+def goto_ready(page: Page, url: str, selector: str, timeout: int = 10000) -> Optional[Response]:
+    """Navigate to ``url`` and return once ``selector`` is on the page.
+
+    ``networkidle`` waits for 500ms of network silence, which ad and analytics
+    traffic can push out by several seconds. Waiting for the content we probe
+    returns as soon as it renders; if it never appears the page is inspected
+    as-is.
+    """
+    response = page.goto(url, wait_until="domcontentloaded")
+    try:
+        page.wait_for_selector(selector, timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
+    return response
+
+
+@asynccontextmanager
+async def async_browser(headless: bool = True) -> AsyncIterator[AsyncBrowser]:
+    """Yield a Chromium browser on the async API for rendering pages concurrently.
+
+    Sync Playwright objects are bound to the thread that created them, so
+    concurrent probes share one browser on a single event loop instead.
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+
+@asynccontextmanager
+async def new_async_context(browser: AsyncBrowser) -> AsyncIterator[AsyncBrowserContext]:
+    """Async counterpart of :func:`new_page`, yielding the fresh context."""
+    context = await browser.new_context()
+    await context.route("**/*", _block_static_async)
+    try:
+        yield context
+    finally:
+        await context.close()
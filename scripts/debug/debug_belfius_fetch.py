@@ -1,25 +1,89 @@
-"""Debug script to test fetching and text extraction for the Belfius PDF."""
+"""Debug script to test fetching and text extraction for the Belfius PDF.
+
+The PDF is streamed to ``data/output/pdf_text/_belfius.pdf`` and reused on
+later runs unless ``--no-cache`` is given. Text is extracted with PyMuPDF by
+default. Pass ``--legacy`` to use the pdfminer extractor from the scraping
+pipeline instead; its output is written next to the PyMuPDF one so the two
+can be diffed.
+"""
 from __future__ import annotations
 
-import sys
+import argparse
 from pathlib import Path
 import logging
 
-# Add src directory to Python path
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = PROJECT_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
-
+from _paths import PROJECT_ROOT
 from be_invest.config_loader import load_brokers_from_yaml
-from be_invest.sources.scrape import _fetch_url
-from be_invest.api.server import pdf_bytes_to_text  # Import the server's extraction logic
+from be_invest.sources.scrape import _DEFAULT_HEADERS, _fetch_url
+
+from _http import CLIENT
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+# pdfminer logs per token at DEBUG/INFO, which dominates extraction time
+for _noisy in ("pdfminer", "pdfplumber", "fitz"):
+    logging.getLogger(_noisy).setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
+PDF_CACHE_PATH = PROJECT_ROOT / "data" / "output" / "pdf_text" / "_belfius.pdf"
+
+
+def _download(url: str, dest: Path) -> int:
+    """Stream ``url`` to ``dest`` in chunks and return the number of bytes written.
+
+    Sends the scraper's browser headers; if the server still answers 403 the
+    scraper's own fetch (with its Playwright fallback) is used instead.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part = dest.with_suffix(dest.suffix + ".part")
+    size = 0
+    try:
+        with CLIENT.stream("GET", url, headers=_DEFAULT_HEADERS, timeout=20.0) as response:
+            if response.status_code == 403:
+                logger.warning("Got 403 for %s, falling back to the scraper's fetch...", url)
+                data, error = _fetch_url(url, timeout=20.0)
+                if not data:
+                    raise RuntimeError(error or "no data returned")
+                part.write_bytes(data)
+                size = len(data)
+            else:
+                response.raise_for_status()
+                with open(part, "wb") as f:
+                    for chunk in response.iter_bytes(1 << 16):
+                        f.write(chunk)
+                        size += len(chunk)
+        part.replace(dest)
+    except BaseException:
+        # Don't leave a partial download behind
+        if part.exists():
+            part.unlink()
+        raise
+    return size
+
+
+def _pdf_text_pymupdf(path: Path) -> str:
+    """Extract text with PyMuPDF, which is far faster than pdfminer."""
+    import pymupdf
+
+    with pymupdf.open(path, filetype="pdf") as doc:
+        return "\n".join(page.get_text("text") for page in doc)
+
+
+def _pdf_text_pdfminer(path: Path) -> str:
+    """Extract text the way the scraping pipeline does."""
+    from pdfminer.high_level import extract_text
+
+    return extract_text(str(path)) or ""
+
+
 def main():
     """Finds the Belfius URL, fetches it, and attempts text extraction."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--legacy", action="store_true",
+                        help="Extract with pdfminer instead of PyMuPDF")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Download the PDF again even if a cached copy exists")
+    args = parser.parse_args()
+
     brokers_yaml_path = PROJECT_ROOT / "data" / "brokers.yaml"
     if not brokers_yaml_path.exists():
         logger.error("Could not find brokers.yaml at: %s", brokers_yaml_path)
@@ -42,29 +106,34 @@ def main():
     logger.info("Found Belfius URL: %s", belfius_url)
 
     # --- Step 1: Fetch the URL ---
-    logger.info("Attempting to fetch the URL...")
-    data = None
-    try:
-        data = _fetch_url(belfius_url, timeout=20.0)
-        if data:
-            logger.info("✅ SUCCESS: Successfully fetched the Belfius PDF (%d bytes).", len(data))
-        else:
-            logger.error("❌ FAILURE: Fetching the URL returned no data.")
+    if PDF_CACHE_PATH.exists() and not args.no_cache:
+        logger.info("Using cached PDF at %s (%d bytes).", PDF_CACHE_PATH, PDF_CACHE_PATH.stat().st_size)
+    else:
+        logger.info("Attempting to fetch the URL...")
+        try:
+            size = _download(belfius_url, PDF_CACHE_PATH)
+            if size:
+                logger.info("✅ SUCCESS: Successfully fetched the Belfius PDF (%d bytes).", size)
+            else:
+                logger.error("❌ FAILURE: Fetching the URL returned no data.")
+                return
+        except Exception:
+            logger.error("❌ EXCEPTION: An error occurred during fetching.", exc_info=True)
             return
-    except Exception:
-        logger.error("❌ EXCEPTION: An error occurred during fetching.", exc_info=True)
-        return
 
     # --- Step 2: Attempt Text Extraction ---
-    logger.info("Attempting to extract text from the downloaded PDF...")
+    extract = _pdf_text_pdfminer if args.legacy else _pdf_text_pymupdf
+    logger.info("Attempting to extract text from the downloaded PDF with %s...",
+                "pdfminer" if args.legacy else "PyMuPDF")
     try:
-        text = pdf_bytes_to_text(data)
+        text = extract(PDF_CACHE_PATH)
         if text and text.strip():
             logger.info("✅ SUCCESS: Successfully extracted text.")
             logger.info("Extracted %d characters.", len(text))
             
             # Save the text to a debug file
-            debug_output_path = PROJECT_ROOT / "data" / "output" / "pdf_text" / "debug_belfius_text.txt"
+            filename = "debug_belfius_text.legacy.txt" if args.legacy else "debug_belfius_text.txt"
+            debug_output_path = PROJECT_ROOT / "data" / "output" / "pdf_text" / filename
             debug_output_path.parent.mkdir(parents=True, exist_ok=True)
             debug_output_path.write_text(text, encoding="utf-8")
             logger.info("Saved extracted text for review to: %s", debug_output_path)
@@ -1,47 +1,53 @@
 """Debug Belfius article structure."""
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from lxml import html as lh
+
+from _cache import cached_html
+from _playwright_pool import BODY_HTML_JS, goto_ready, new_page, shared_browser
 
 url = "https://www.belfius.be/retail/nl/publicaties/actualiteit/index.aspx"
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    page = browser.new_page()
-    page.goto(url, wait_until="networkidle")
-    html = page.content()
-    browser.close()
 
-soup = BeautifulSoup(html, 'lxml')
-articles = soup.find_all('article')
+def _render(url):
+    with shared_browser() as browser, new_page(browser) as page:
+        goto_ready(page, url, "article")
+        return page.evaluate(BODY_HTML_JS)
+
+
+html = cached_html(url, _render)
+
+doc = lh.document_fromstring(html)
+articles = doc.xpath('//article')
 
-print(f"Found {len(articles)} articles\n")
+# Build the report and write it in one call rather than a print per line
+out = [f"Found {len(articles)} articles\n"]
 
 # Inspect first 3 articles
 for i, art in enumerate(articles[:3]):
-    print(f"=== Article {i+1} ===")
-    print(f"Classes: {art.get('class', [])}")
+    out.append(f"=== Article {i+1} ===")
+    out.append(f"Classes: {art.get('class', '').split()}")
 
     # Check for headers
     for tag in ['h1', 'h2', 'h3', 'h4']:
-        headers = art.find_all(tag)
+        headers = art.findall(f'.//{tag}')
         if headers:
-            print(f"{tag}: {len(headers)} found")
+            out.append(f"{tag}: {len(headers)} found")
             for h in headers:
-                print(f"  - {h.get_text().strip()[:80]}")
+                out.append(f"  - {h.text_content().strip()[:80]}")
 
     # Check for links
-    links = art.find_all('a')
+    links = art.findall('.//a')
     if links:
-        print(f"Links: {len(links)}")
+        out.append(f"Links: {len(links)}")
         for link in links[:2]:
-            print(f"  - href: {link.get('href', 'N/A')[:80]}")
-            print(f"    text: {link.get_text().strip()[:80]}")
+            out.append(f"  - href: {link.get('href', 'N/A')[:80]}")
+            out.append(f"    text: {link.text_content().strip()[:80]}")
 
     # Check for paragraphs
-    paras = art.find_all('p')
+    paras = art.findall('.//p')
     if paras:
-        print(f"Paragraphs: {len(paras)}")
-        print(f"  First p: {paras[0].get_text().strip()[:80]}")
+        out.append(f"Paragraphs: {len(paras)}")
+        out.append(f"  First p: {paras[0].text_content().strip()[:80]}")
 
-    print()
+    out.append("")
 
+print("\n".join(out))
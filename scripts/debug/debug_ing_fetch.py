@@ -1,18 +1,11 @@
 """Debug script to test fetching and text extraction for the ING Self Invest PDF."""
 from __future__ import annotations
 
-import sys
-from pathlib import Path
 import logging
 import hashlib
 import re
 
-# Add src directory to Python path
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = PROJECT_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
-
+from _paths import PROJECT_ROOT
 from be_invest.config_loader import load_brokers_from_yaml
 from be_invest.sources.scrape import _fetch_url
 from be_invest.api.server import pdf_bytes_to_text  # Import the server's extraction logic
@@ -1,44 +1,50 @@
 """Debug Keytrade article structure."""
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from lxml import html as lh
+
+from _cache import cached_html
+from _playwright_pool import BODY_HTML_JS, goto_ready, new_page, shared_browser
 
 url = "https://www.keytradebank.be/en/our-blog/investing/"
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    page = browser.new_page()
-    page.goto(url, wait_until="networkidle")
-    html = page.content()
-    browser.close()
 
-soup = BeautifulSoup(html, 'lxml')
-cards = soup.select("a[class*='Card']")
+def _render(url):
+    with shared_browser() as browser, new_page(browser) as page:
+        goto_ready(page, url, "a[class*='Card']")
+        return page.evaluate(BODY_HTML_JS)
+
+
+html = cached_html(url, _render)
+
+doc = lh.document_fromstring(html)
+cards = doc.xpath("//a[contains(@class, 'Card')]")
 
-print(f"Found {len(cards)} card links\n")
+# Build the report and write it in one call rather than a print per line
+out = [f"Found {len(cards)} card links\n"]
 
 # Inspect first 2
 for i, card in enumerate(cards[:2]):
-    print(f"=== Card {i+1} ===")
-    print(f"href: {card.get('href', 'N/A')[:80]}")
+    out.append(f"=== Card {i+1} ===")
+    out.append(f"href: {card.get('href', 'N/A')[:80]}")
 
     # Check for headers
     for tag in ['h1', 'h2', 'h3', 'h4']:
-        headers = card.find_all(tag)
+        headers = card.findall(f'.//{tag}')
         if headers:
-            print(f"{tag}: {len(headers)} found")
+            out.append(f"{tag}: {len(headers)} found")
             for h in headers:
-                print(f"  text: {h.get_text().strip()[:80]}")
+                out.append(f"  text: {h.text_content().strip()[:80]}")
 
     # Direct text
-    text = card.get_text(separator=' ', strip=True)
-    print(f"All text: {text[:150]}")
+    text = ' '.join(s.strip() for s in card.itertext() if s.strip())
+    out.append(f"All text: {text[:150]}")
 
     # Paragraphs
-    paras = card.find_all('p')
+    paras = card.findall('.//p')
     if paras:
-        print(f"Paragraphs: {len(paras)}")
+        out.append(f"Paragraphs: {len(paras)}")
         for p in paras[:2]:
-            print(f"  - {p.get_text().strip()[:80]}")
+            out.append(f"  - {p.text_content().strip()[:80]}")
 
-    print()
+    out.append("")
 
+print("\n".join(out))
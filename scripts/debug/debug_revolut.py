@@ -1,26 +1,36 @@
 """Debug Revolut structure."""
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from html import escape
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    page = browser.new_page()
-    page.goto("https://www.revolut.com/en-BE/news/", wait_until="networkidle")
-    html = page.content()
-    browser.close()
+from lxml import html as lh
 
-soup = BeautifulSoup(html, 'lxml')
+from _cache import cached_html
+from _playwright_pool import BODY_HTML_JS, goto_ready, new_page, shared_browser
 
-print(f"Title: {soup.title.string if soup.title else 'N/A'}\n")
+url = "https://www.revolut.com/en-BE/news/"
+
+
+def _render(url):
+    with shared_browser() as browser, new_page(browser) as page:
+        goto_ready(page, url, "h2")
+        # Keep the title with the body so it survives the cache
+        head = f"<head><title>{escape(page.title())}</title></head>"
+        return f"<html>{head}{page.evaluate(BODY_HTML_JS)}</html>"
+
+
+html = cached_html(url, _render)
+doc = lh.document_fromstring(html)
+
+title = doc.findtext('.//title')
+print(f"Title: {title or 'N/A'}\n")
 
 # Try different selectors
 selectors = [
-    ("article", soup.find_all('article')),
-    ("div[class*='post']", soup.select("div[class*='post']")),
-    ("div[class*='Post']", soup.select("div[class*='Post']")),
-    ("div[class*='card']", soup.select("div[class*='card']")),
-    ("div[class*='Card']", soup.select("div[class*='Card']")),
-    ("a[class*='card']", soup.select("a[class*='card']")),
+    ("article", doc.xpath('//article')),
+    ("div[class*='post']", doc.xpath("//div[contains(@class, 'post')]")),
+    ("div[class*='Post']", doc.xpath("//div[contains(@class, 'Post')]")),
+    ("div[class*='card']", doc.xpath("//div[contains(@class, 'card')]")),
+    ("div[class*='Card']", doc.xpath("//div[contains(@class, 'Card')]")),
+    ("a[class*='card']", doc.xpath("//a[contains(@class, 'card')]")),
 ]
 
 for name, results in selectors:
@@ -28,15 +38,15 @@ for name, results in selectors:
         print(f"{name}: {len(results)} found")
 
 # Check h2/h3
-h2s = soup.find_all('h2')
-h3s = soup.find_all('h3')
+h2s = doc.xpath('//h2')
+h3s = doc.xpath('//h3')
 print(f"\nh2 tags: {len(h2s)}")
 print(f"h3 tags: {len(h3s)}")
 
 if h2s:
     print("\nSample h2s:")
     for h in h2s[:3]:
-        text = h.get_text().strip()
+        text = h.text_content().strip()
         if len(text) > 10:
             print(f"  - {text[:80]}")
 
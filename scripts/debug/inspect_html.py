@@ -1,39 +1,60 @@
 """Inspect HTML structure of broker news pages."""
-import requests
-from bs4 import BeautifulSoup
+from collections import Counter
+
+from lxml import html as lh
+
+from _cache import cached_html
+from _http import CLIENT
 
 url = 'https://www.bolero.be/nl/analyse-en-inzicht/blog'
-print(f"Fetching {url}...")
-r = requests.get(url)
-soup = BeautifulSoup(r.content, 'lxml')
-
-print(f"\n=== HTML Structure Analysis ===")
-print(f"Article tags: {len(soup.find_all('article'))}")
-print(f"Divs with 'blog' in class: {len(soup.find_all('div', class_=lambda x: x and 'blog' in str(x).lower()))}")
-print(f"Divs with 'card' in class: {len(soup.find_all('div', class_=lambda x: x and 'card' in str(x).lower()))}")
-print(f"Divs with 'item' in class: {len(soup.find_all('div', class_=lambda x: x and 'item' in str(x).lower()))}")
-print(f"Divs with 'post' in class: {len(soup.find_all('div', class_=lambda x: x and 'post' in str(x).lower()))}")
-print(f"Links (a tags): {len(soup.find_all('a'))}")
-
-print(f"\n=== Common patterns ===")
+
+
+def _fetch(url):
+    print(f"Fetching {url}...")
+    r = CLIENT.get(url)
+    # Raise rather than return an error page, which would then be cached
+    r.raise_for_status()
+    return r.text
+
+
+doc = lh.fromstring(cached_html(url, _fetch))
+
+DIV_CLASS_KEYWORDS = ('blog', 'card', 'item', 'post')
+
+# Pull the div class attributes out as plain strings in C; no element
+# proxies are created and the keyword test runs once per distinct class
+class_counts = Counter(' '.join(c.split()) for c in doc.xpath('//div/@class'))
+class_counts.pop('', None)
+div_keyword_counts = Counter()
+for classes, count in class_counts.items():
+    lowered = classes.lower()
+    for keyword in DIV_CLASS_KEYWORDS:
+        if keyword in lowered:
+            div_keyword_counts[keyword] += count
+
+article_count = int(doc.xpath('count(//article)'))
+link_count = int(doc.xpath('count(//a)'))
+headers_by_tag = {tag: doc.xpath(f'//{tag}') for tag in ('h1', 'h2', 'h3')}
+
+# Collect the report and write it in one call
+out = [f"\n=== HTML Structure Analysis ==="]
+out.append(f"Article tags: {article_count}")
+for keyword in DIV_CLASS_KEYWORDS:
+    out.append(f"Divs with '{keyword}' in class: {div_keyword_counts[keyword]}")
+out.append(f"Links (a tags): {link_count}")
+
+out.append(f"\n=== Common patterns ===")
 # Look for repeating patterns that might be blog posts
-all_divs = soup.find_all('div', class_=True)
-class_counts = {}
-for div in all_divs:
-    classes = ' '.join(div.get('class', []))
-    if classes:
-        class_counts[classes] = class_counts.get(classes, 0) + 1
-
-print("Most common div classes (top 10):")
-for cls, count in sorted(class_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
+out.append("Most common div classes (top 10):")
+for cls, count in class_counts.most_common(10):
     if count > 2:  # Only show repeated elements
-        print(f"  {count}x: {cls}")
+        out.append(f"  {count}x: {cls}")
 
-print("\n=== Sample h2/h3 titles ===")
-for tag in ['h1', 'h2', 'h3']:
-    headers = soup.find_all(tag)
+out.append("\n=== Sample h2/h3 titles ===")
+for tag, headers in headers_by_tag.items():
     if headers:
-        print(f"{tag}: {len(headers)} found")
+        out.append(f"{tag}: {len(headers)} found")
         for h in headers[:3]:
-            print(f"  - {h.get_text().strip()[:80]}")
+            out.append(f"  - {h.text_content().strip()[:80]}")
 
+print("\n".join(out))
@@ -1,43 +1,55 @@
 """Test ING newsroom page structure."""
-import requests
-from bs4 import BeautifulSoup
+from lxml import html as lh
+
+from _cache import cached_html
+from _http import CLIENT
 
 url = "https://newsroom.ing.be/en?category=9986"
-print(f"Fetching {url}...")
-r = requests.get(url, timeout=10)
-print(f"Status: {r.status_code}")
-print(f"Content length: {len(r.content)} bytes\n")
 
-soup = BeautifulSoup(r.content, 'lxml')
+
+def _fetch(url):
+    print(f"Fetching {url}...")
+    r = CLIENT.get(url, timeout=10)
+    print(f"Status: {r.status_code}")
+    # Raise rather than return an error page, which would then be cached
+    r.raise_for_status()
+    print(f"Content length: {len(r.content)} bytes "
+          f"({r.num_bytes_downloaded} on the wire, {r.headers.get('content-encoding', 'identity')})\n")
+    return r.text
+
+
+doc = lh.fromstring(cached_html(url, _fetch))
 
 print("=== Structure Analysis ===")
-print(f"Article tags: {len(soup.find_all('article'))}")
-news_divs = soup.select('div[class*="news"]')
+articles = doc.xpath('//article')
+print(f"Article tags: {len(articles)}")
+news_divs = doc.xpath("//div[contains(@class, 'news')]")
 print(f"Divs with 'news' in class: {len(news_divs)}")
-print(f"Divs with 'post' in class: {len(soup.select('div[class*=\"post\"]'))}")
-print(f"Divs with 'item' in class: {len(soup.select('div[class*=\"item\"]'))}")
-print(f"Links (a tags): {len(soup.find_all('a'))}")
+post_divs = doc.xpath("//div[contains(@class, 'post')]")
+print(f"Divs with 'post' in class: {len(post_divs)}")
+item_divs = doc.xpath("//div[contains(@class, 'item')]")
+print(f"Divs with 'item' in class: {len(item_divs)}")
+print(f"Links (a tags): {len(doc.xpath('//a'))}")
 
 print("\n=== Headers ===")
 for tag in ['h1', 'h2', 'h3']:
-    headers = soup.find_all(tag)
+    headers = doc.xpath(f'//{tag}')
     if headers:
         print(f"{tag}: {len(headers)} found")
         for h in headers[:3]:
-            text = h.get_text().strip()
+            text = h.text_content().strip()
             if text and len(text) > 10:
                 print(f"  - {text[:80]}")
 
 # Check for article containers
-articles = soup.find_all('article')
 if articles:
     print(f"\n=== Sample Article Structure ===")
     art = articles[0]
-    print(f"Article classes: {art.get('class', [])}")
-    h2 = art.find('h2')
-    if h2:
-        print(f"H2: {h2.get_text().strip()[:80]}")
-    links = art.find_all('a')
+    print(f"Article classes: {art.get('class', '').split()}")
+    h2 = art.find('.//h2')
+    if h2 is not None:
+        print(f"H2: {h2.text_content().strip()[:80]}")
+    links = art.findall('.//a')
     if links:
         print(f"Links in article: {len(links)}")
         print(f"  First link: {links[0].get('href', 'N/A')}")
@@ -1,50 +1,54 @@
 """Test ING newsroom with Playwright."""
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from lxml import html as lh
+
+from _cache import cached_html
+from _playwright_pool import BODY_HTML_JS, goto_ready, new_page, shared_browser
 
 url = "https://newsroom.ing.be/en?category=9986"
 print(f"Testing {url} with Playwright...")
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    page = browser.new_page()
 
-    try:
-        response = page.goto(url, wait_until="networkidle", timeout=30000)
+def _render(url):
+    with shared_browser() as browser, new_page(browser) as page:
+        response = goto_ready(page, url, "article, h2")
         print(f"Status: {response.status}")
 
-        html = page.content()
-        print(f"HTML size: {len(html)} bytes\n")
-
-        soup = BeautifulSoup(html, 'lxml')
-
-        print("=== Structure Analysis ===")
-        print(f"Article tags: {len(soup.find_all('article'))}")
-        news_divs = soup.select('div[class*="news"]')
-        print(f"Divs with 'news' in class: {len(news_divs)}")
-        print(f"Divs with 'card' in class: {len(soup.select('div[class*=\"card\"]'))}")
-        print(f"Links (a tags): {len(soup.find_all('a'))}")
-
-        print("\n=== Headers ===")
-        h2s = soup.find_all('h2')
-        print(f"H2 tags: {len(h2s)} found")
-        for h in h2s[:5]:
-            text = h.get_text().strip()
-            if text and len(text) > 10:
-                print(f"  - {text[:80]}")
-
-        # Look for article containers
-        articles = soup.find_all('article')
-        if articles:
-            print(f"\n=== First Article ===")
-            art = articles[0]
-            print(f"Classes: {art.get('class', [])}")
-            title = art.find(['h1', 'h2', 'h3'])
-            if title:
-                print(f"Title: {title.get_text().strip()[:80]}")
-
-    except Exception as e:
-        print(f"Error: {str(e)}")
-    finally:
-        browser.close()
+        html = page.evaluate(BODY_HTML_JS)
+        head_size = page.evaluate("() => document.head.outerHTML.length")
+        print(f"HTML size: {len(html)} bytes body + {head_size} bytes head (not fetched)\n")
+        return html
+
+
+try:
+    html = cached_html(url, _render)
+    doc = lh.document_fromstring(html)
+
+    print("=== Structure Analysis ===")
+    articles = doc.xpath('//article')
+    print(f"Article tags: {len(articles)}")
+    news_divs = doc.xpath("//div[contains(@class, 'news')]")
+    print(f"Divs with 'news' in class: {len(news_divs)}")
+    card_divs = doc.xpath("//div[contains(@class, 'card')]")
+    print(f"Divs with 'card' in class: {len(card_divs)}")
+    print(f"Links (a tags): {len(doc.xpath('//a'))}")
+
+    print("\n=== Headers ===")
+    h2s = doc.xpath('//h2')
+    print(f"H2 tags: {len(h2s)} found")
+    for h in h2s[:5]:
+        text = h.text_content().strip()
+        if text and len(text) > 10:
+            print(f"  - {text[:80]}")
+
+    # Look for article containers
+    if articles:
+        print(f"\n=== First Article ===")
+        art = articles[0]
+        print(f"Classes: {art.get('class', '').split()}")
+        titles = art.xpath('.//h1 | .//h2 | .//h3')
+        if titles:
+            print(f"Title: {titles[0].text_content().strip()[:80]}")
+
+except Exception as e:
+    print(f"Error: {str(e)}")
 
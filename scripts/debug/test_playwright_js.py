@@ -1,14 +1,16 @@
 """Test Playwright rendering for JS-heavy pages."""
-import sys
-from pathlib import Path
+import asyncio
 import logging
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
+import _paths  # noqa: F401  (puts src/ on sys.path)
 
 logging.basicConfig(level=logging.INFO)
 
-from playwright.sync_api import sync_playwright
+from lxml import html as lh
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from _cache import read_cached, write_cached
+from _playwright_pool import BODY_HTML_JS, async_browser, new_async_context
 
 urls_to_test = [
     ("Keytrade", "https://www.keytradebank.be/en/our-blog/investing/"),
@@ -16,35 +18,56 @@ urls_to_test = [
     ("ING", "https://www.ing.be/en/individuals/news/economy-and-financial-markets"),
 ]
 
-with sync_playwright() as p:
-    browser = p.chromium.launch(headless=True)
-    for name, url in urls_to_test:
-        print(f"\n{'='*60}")
-        print(f"{name}: {url}")
-        try:
-            page = browser.new_page()
-            response = page.goto(url, wait_until="networkidle", timeout=30000)
-            print(f"  Status: {response.status}")
+# Element that signals the article list has rendered, per site
+ready_selectors = {
+    "Keytrade": "a[class*='Card']",
+    "Degiro": "article, h2",
+    "ING": "h2",
+}
+
+
+async def probe(browser, name, url):
+    """Render one URL in its own context and return its report lines."""
+    lines = [f"\n{'='*60}", f"{name}: {url}"]
+    try:
+        html = read_cached(url)
+        if html is None:
+            async with new_async_context(browser) as context:
+                page = await context.new_page()
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                try:
+                    await page.wait_for_selector(ready_selectors.get(name, "h2"), timeout=10000)
+                except PlaywrightTimeoutError:
+                    pass
+                lines.append(f"  Status: {response.status}")
+                html = await page.evaluate(BODY_HTML_JS)
+            write_cached(url, html)
+        else:
+            lines.append("  (cached HTML; pass --refresh to re-render)")
+        lines.append(f"  Body HTML size: {len(html)} bytes")
 
-            html = page.content()
-            print(f"  HTML size: {len(html)} bytes")
+        # Check for common news article patterns
+        doc = lh.document_fromstring(html)
+        h2s = doc.xpath('//h2')
 
-            # Check for common news article patterns
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'lxml')
+        lines.append(f"  Articles: {len(doc.xpath('//article'))}")
+        lines.append(f"  H2 tags: {len(h2s)}")
+        lines.append(f"  Links: {len(doc.xpath('//a'))}")
 
-            print(f"  Articles: {len(soup.find_all('article'))}")
-            print(f"  H2 tags: {len(soup.find_all('h2'))}")
-            print(f"  Links: {len(soup.find_all('a'))}")
+        # Sample h2
+        if h2s:
+            lines.append(f"  Sample h2: '{h2s[0].text_content().strip()[:60]}'")
+    except Exception as e:
+        lines.append(f"  Error: {str(e)[:100]}")
+    return lines
 
-            # Sample h2
-            h2s = soup.find_all('h2')
-            if h2s:
-                print(f"  Sample h2: '{h2s[0].get_text().strip()[:60]}'")
 
-            page.close()
-        except Exception as e:
-            print(f"  Error: {str(e)[:100]}")
+async def main():
+    """Render all URLs concurrently, then print the reports in list order."""
+    async with async_browser() as browser:
+        reports = await asyncio.gather(*(probe(browser, name, url) for name, url in urls_to_test))
+    for lines in reports:
+        print("\n".join(lines))
 
-    browser.close()
 
+asyncio.run(main())
@@ -1,11 +1,7 @@
 """Quick test to see Playwright debug logs."""
-import sys
 import logging
-from pathlib import Path
 
-# Setup path
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
+from _paths import PROJECT_ROOT
 
 # Configure debug logging
 logging.basicConfig(
@@ -7,6 +7,8 @@ What it does:
 - Prints the Python executable used.
 - Checks whether `playwright` and other dependencies are importable.
 - If importable, attempts to start a headless Chromium browser (safe quick test).
+  A successful launch is cached in ``data/.playwright_ok`` for 24 hours; pass
+  ``--force`` to launch anyway.
 - On common failures, prints exact commands to run (using the same interpreter).
 - Shows environment variable settings that affect Playwright behavior.
 
@@ -15,8 +17,14 @@ The script does NOT auto-install; it only provides guidance and optional CLI com
 from __future__ import annotations
 import sys
 import os
+import time
 import traceback
 
+from _paths import PROJECT_ROOT
+
+LAUNCH_OK_MARKER = PROJECT_ROOT / "data" / ".playwright_ok"
+LAUNCH_OK_TTL_SECONDS = 24 * 60 * 60
+
 def main():
     print("=" * 80)
     print("🔍 BE-INVEST PLAYWRIGHT & DEPENDENCIES VALIDATION")
@@ -72,6 +80,11 @@ def main():
 
     # Try a quick headless launch test to check browser binaries
     print("\n🚀 Testing Chromium Launch:")
+    if '--force' not in sys.argv and LAUNCH_OK_MARKER.exists():
+        age = time.time() - LAUNCH_OK_MARKER.stat().st_mtime
+        if age < LAUNCH_OK_TTL_SECONDS:
+            print(f"  ✅ cached OK (launched successfully {age / 3600:.1f}h ago; use --force to re-test)")
+            return 0
     try:
         print("  Attempting headless Chromium launch (tests browser binaries)...")
         with sync_playwright() as p:
@@ -79,6 +92,12 @@ def main():
             browser_version = getattr(browser, 'version', None)
             browser.close()
 
+        try:
+            LAUNCH_OK_MARKER.parent.mkdir(parents=True, exist_ok=True)
+            LAUNCH_OK_MARKER.touch()
+        except OSError:
+            pass
+
         print(f"  ✅ SUCCESS: Chromium launched OK" + (f" (version: {browser_version})" if browser_version else ""))
         print("\n" + "=" * 80)
         print("✅ RESULT: Playwright and Chromium are fully functional!")
@@ -5,10 +5,17 @@ This script demonstrates the complete workflow of extracting broker fees
 and generating detailed cost summaries using the latest AI models.
 """
 
+import os
 import sys
+from collections import Counter, defaultdict
 from pathlib import Path
 import json
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
@@ -60,27 +67,22 @@ def main():
     if extracted_path.exists():
         print("✅ EXTRACTED FEES AVAILABLE:\n")
         try:
-            with open(extracted_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            print(f"   Found {len(data)} fee records")
-
-            # Group by broker
-            by_broker = {}
-            for record in data:
-                broker = record.get('broker', 'Unknown')
-                if broker not in by_broker:
-                    by_broker[broker] = []
-                by_broker[broker].append(record)
-
-            for broker, records in sorted(by_broker.items()):
+            # Count records per broker and instrument; with ijson the file is
+            # streamed so only the counters are kept in memory
+            record_count = 0
+            by_broker = defaultdict(Counter)
+            with open(extracted_path, 'rb') as f:
+                records = ijson.items(f, 'item') if ijson is not None else json.load(f)
+                for record in records:
+                    record_count += 1
+                    broker = record.get('broker', 'Unknown')
+                    by_broker[broker][record.get('instrument_type', 'Unknown')] += 1
+            print(f"   Found {record_count} fee records")
+
+            for broker, by_instrument in sorted(by_broker.items()):
                 print(f"\n   {broker}:")
-                by_instrument = {}
-                for r in records:
-                    inst = r.get('instrument_type', 'Unknown')
-                    by_instrument.setdefault(inst, []).append(r)
-
-                for inst, inst_records in sorted(by_instrument.items()):
-                    print(f"     - {inst}: {len(inst_records)} records")
+                for inst, count in sorted(by_instrument.items()):
+                    print(f"     - {inst}: {count} records")
         except Exception as e:
             print(f"   Error reading extracted fees: {e}")
     else:
@@ -93,10 +95,9 @@ def main():
     if summary_path.exists():
         print("✅ SUMMARY AVAILABLE:\n")
         print(f"   Location: {summary_path}\n")
+        # Show first 500 chars; no need to read the whole summary
         with open(summary_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        # Show first 500 chars
-        preview = content[:500]
+            preview = f.read(500)
         print("   Preview:")
         for line in preview.split('\n')[:10]:
             print(f"   {line}")
@@ -117,12 +118,14 @@ def main():
     # List available text files
     pdf_text_dir = PROJECT_ROOT / "data" / "output" / "pdf_text"
     if pdf_text_dir.exists():
-        txt_files = list(pdf_text_dir.glob("*.txt"))
+        # scandir entries carry their own stat result, saving a syscall per file
+        with os.scandir(pdf_text_dir) as entries:
+            txt_files = [e for e in entries if e.name.endswith(".txt")]
         if txt_files:
             print(f"Available PDF text files ({len(txt_files)}):")
-            for f in txt_files:
-                size_kb = f.stat().st_size / 1024
-                print(f"  - {f.name} ({size_kb:.1f} KB)")
+            for entry in txt_files:
+                size_kb = entry.stat().st_size / 1024
+                print(f"  - {entry.name} ({size_kb:.1f} KB)")
         else:
             print("No PDF text files found in data/output/pdf_text/")
     print()
@@ -4,11 +4,13 @@ News Dashboard Demo - Shows how to use the automated news system
 """
 import sys
 import time
+from collections import Counter
 from pathlib import Path
 
-# Add the project root to sys.path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root / "src"))
+# Add the project's src/ to sys.path (scripts/demos -> project root)
+project_root = Path(__file__).parents[2]
+if str(project_root / "src") not in sys.path:
+    sys.path.insert(0, str(project_root / "src"))
 
 from be_invest.news import load_news, get_news_statistics
 from be_invest.config_loader import load_brokers_from_yaml
@@ -81,9 +83,7 @@ def run_automated_scraping():
 
         if scraped_news:
             # Group by broker
-            broker_counts = {}
-            for news in scraped_news:
-                broker_counts[news.broker] = broker_counts.get(news.broker, 0) + 1
+            broker_counts = Counter(news.broker for news in scraped_news)
 
             print(f"   Breakdown by broker:")
             for broker, count in broker_counts.items():
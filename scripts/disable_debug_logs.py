@@ -6,23 +6,12 @@ from pathlib import Path
 
 filePath = Path(__file__).parent.parent / "src" / "be_invest" / "api" / "server.py"
 
-with open(filePath, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
+# Comment out logger.debug statements, preserving indentation. Lines that are
+# already commented start with '#', so they never match. One C-level pass over
+# the whole file instead of a Python loop per line.
+DEBUG_CALL = re.compile(rb'^([ \t]*)(?=logger\.debug\()', re.M)
 
-# Process each line and comment out logger.debug statements
-new_lines = []
-for line in lines:
-    stripped = line.lstrip()
-    # Only comment out if not already commented
-    if stripped.startswith('logger.debug(') and not line.lstrip().startswith('# logger.debug'):
-        # Preserve indentation
-        indent = len(line) - len(stripped)
-        new_lines.append(' ' * indent + '# ' + line[indent:])
-    else:
-        new_lines.append(line)
-
-with open(filePath, 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
+data = filePath.read_bytes()
+filePath.write_bytes(DEBUG_CALL.sub(rb'\1# ', data))
 
 print("✅ All logger.debug calls have been commented out")
-
@@ -11,6 +11,8 @@ Usage:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Ensure project root is on sys.path so we can import be_invest
@@ -24,6 +26,28 @@ from scripts.eval.config import (
     DATASET_FEE_ACCURACY, DATASET_BROKER_COMPARISON,
 )
 
+# Both datasets walk the same (broker, instrument, amount) grid; compute each
+# fee once
+_calculate_fee = lru_cache(maxsize=None)(calculate_fee)
+
+# Each create_dataset_item call is a blocking HTTP request; overlap them
+UPLOAD_CONCURRENCY = 16
+
+
+def _upload_items(langfuse: Langfuse, dataset_name: str, items: list) -> int:
+    """Create dataset items concurrently.
+
+    Each item is a dict of ``id``, ``input`` and ``expected_output``.
+    Returns number of items uploaded.
+    """
+    def upload(item: dict) -> None:
+        langfuse.create_dataset_item(dataset_name=dataset_name, **item)
+
+    with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as ex:
+        # list() drains the iterator so any upload error is raised here
+        list(ex.map(upload, items))
+    return len(items)
+
 
 def create_fee_accuracy_dataset(langfuse: Langfuse) -> int:
     """Create single-broker fee-accuracy dataset items.
@@ -35,11 +59,11 @@ def create_fee_accuracy_dataset(langfuse: Langfuse) -> int:
         description="Single-broker fee questions with deterministic ground truth",
     )
 
-    count = 0
+    items = []
     for broker in BROKERS:
         for instrument in INSTRUMENTS:
             for amount in AMOUNTS:
-                fee = calculate_fee(broker, instrument, amount)
+                fee = _calculate_fee(broker, instrument, amount)
                 if fee is None:
                     continue
 
@@ -47,19 +71,19 @@ def create_fee_accuracy_dataset(langfuse: Langfuse) -> int:
                 item_id = f"{broker}-{instrument}-{amount}".lower().replace(" ", "-")
                 question = f"How much does {broker} charge for a EUR{amount} {instrument.rstrip('s')} trade?"
 
-                langfuse.create_dataset_item(
-                    dataset_name=DATASET_FEE_ACCURACY,
-                    id=item_id,
-                    input={"question": question},
-                    expected_output={
+                items.append({
+                    "id": item_id,
+                    "input": {"question": question},
+                    "expected_output": {
                         "broker": broker,
                         "instrument": instrument,
                         "amount": amount,
                         "fee": fee,
                         "explanation": explanation,
                     },
-                )
-                count += 1
+                })
+
+    count = _upload_items(langfuse, DATASET_FEE_ACCURACY, items)
 
     print(f"  {DATASET_FEE_ACCURACY}: {count} items")
     return count
@@ -75,12 +99,12 @@ def create_comparison_dataset(langfuse: Langfuse) -> int:
         description="Multi-broker comparison questions with deterministic ground truth",
     )
 
-    count = 0
+    items = []
     for instrument in INSTRUMENTS:
         for amount in AMOUNTS:
             fees = {}
             for broker in BROKERS:
-                fee = calculate_fee(broker, instrument, amount)
+                fee = _calculate_fee(broker, instrument, amount)
                 if fee is not None:
                     fees[broker] = fee
 
@@ -91,18 +115,18 @@ def create_comparison_dataset(langfuse: Langfuse) -> int:
             item_id = f"compare-{instrument}-{amount}"
             question = f"Compare all brokers for a EUR{amount} {instrument.rstrip('s')} purchase. Which is cheapest?"
 
-            langfuse.create_dataset_item(
-                dataset_name=DATASET_BROKER_COMPARISON,
-                id=item_id,
-                input={"question": question},
-                expected_output={
+            items.append({
+                "id": item_id,
+                "input": {"question": question},
+                "expected_output": {
                     "instrument": instrument,
                     "amount": amount,
                     "fees": fees,
                     "cheapest": cheapest,
                 },
-            )
-            count += 1
+            })
+
+    count = _upload_items(langfuse, DATASET_BROKER_COMPARISON, items)
 
     print(f"  {DATASET_BROKER_COMPARISON}: {count} items")
     return count
@@ -17,15 +17,33 @@ Usage:
     python scripts/eval/run_chat_eval.py
     python scripts/eval/run_chat_eval.py --dataset chat-fee-accuracy --limit 5
     python scripts/eval/run_chat_eval.py --model groq/llama-3.3-70b-versatile --run-name groq-llama
+    python scripts/eval/run_chat_eval.py --max-concurrency 4
+    python scripts/eval/run_chat_eval.py --replay data/output/eval/eval_responses_<run>.ndjson
+
+Every /chat response is appended to data/output/eval/eval_responses_<run>.ndjson;
+--replay rescores such a file without calling the API again.
 """
 
 import argparse
+import json
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
 
 import requests
 from langfuse import Langfuse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     # SDK v3: langfuse.decorators was removed.
     from langfuse import observe, get_client as _lf_get_client  # type: ignore[assignment]
@@ -54,6 +72,21 @@ from scripts.eval.config import (
     API_BASE_URL, TOLERANCE,
 )
 
+DEFAULT_MAX_CONCURRENCY = 16
+RESPONSES_DIR = Path(__file__).resolve().parents[2] / "data" / "output" / "eval"
+
+# One keep-alive pool shared by the eval threads, sized above the default
+# concurrency. urllib3 does not retry POST after the request was sent, so the
+# retries only cover failed connection attempts.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 @observe(name="chat-eval-call")
 def call_chat_api(question: str, model: str | None = None) -> dict:
@@ -62,9 +95,9 @@ def call_chat_api(question: str, model: str | None = None) -> dict:
     if model:
         payload["model"] = model
 
-    resp = requests.post(f"{API_BASE_URL}/chat", json=payload, timeout=120)
+    resp = _session.post(f"{API_BASE_URL}/chat", json=payload, timeout=120)
     resp.raise_for_status()
-    result = resp.json()
+    result = orjson.loads(resp.content) if orjson is not None else resp.json()
 
     langfuse_context.update_current_observation(
         input=payload,
@@ -73,7 +106,7 @@ def call_chat_api(question: str, model: str | None = None) -> dict:
     return result
 
 
-def score_fee_accuracy(response: dict, expected: dict, langfuse: Langfuse, trace_id: str) -> dict:
+def score_fee_accuracy(response: dict, expected: dict) -> dict:
     """Score a single-broker fee response. Returns dict of score names -> values."""
     scores = {}
     answer = response.get("answer", "")
@@ -100,23 +133,19 @@ def score_fee_accuracy(response: dict, expected: dict, langfuse: Langfuse, trace
     else:
         scores["fee_accurate"] = 0.0
 
-    # Submit scores to Langfuse
-    for name, value in scores.items():
-        langfuse.score(trace_id=trace_id, name=name, value=value)
-
     return scores
 
 
-def score_comparison(response: dict, expected: dict, langfuse: Langfuse, trace_id: str) -> dict:
+def score_comparison(response: dict, expected: dict) -> dict:
     """Score a multi-broker comparison response. Returns dict of score names -> values."""
     scores = {}
-    answer = response.get("answer", "")
+    answer_lower = response.get("answer", "").lower()
     pre_computed = response.get("pre_computed")
     expected_cheapest = expected["cheapest"]
     expected_fees = expected["fees"]
 
     # cheapest_correct: does the answer mention the cheapest broker?
-    scores["cheapest_correct"] = 1.0 if expected_cheapest.lower() in answer.lower() else 0.0
+    scores["cheapest_correct"] = 1.0 if expected_cheapest.lower() in answer_lower else 0.0
 
     # all_fees_accurate: fraction of broker fees that match
     if pre_computed:
@@ -130,12 +159,22 @@ def score_comparison(response: dict, expected: dict, langfuse: Langfuse, trace_i
     else:
         scores["all_fees_accurate"] = 0.0
 
-    for name, value in scores.items():
-        langfuse.score(trace_id=trace_id, name=name, value=value)
-
     return scores
 
 
+def _submit_scores(langfuse: Langfuse, scored: list[tuple[str, dict]]) -> None:
+    """Queue every (trace_id, scores) pair for Langfuse's batched ingest.
+
+    Scores are submitted from one thread once all responses are in; the
+    caller flushes once at the end of the run.
+    """
+    # SDK v3 renamed score() to create_score()
+    create_score = getattr(langfuse, "create_score", None) or langfuse.score
+    for trace_id, scores in scored:
+        for name, value in scores.items():
+            create_score(trace_id=trace_id, name=name, value=value)
+
+
 def _extract_fee_from_precomputed(pre_computed: dict, broker: str, instrument: str) -> float | None:
     """Extract a fee value from the pre_computed response dict.
 
@@ -162,8 +201,64 @@ def _extract_fee_from_precomputed(pre_computed: dict, broker: str, instrument: s
     return None
 
 
-def run_eval(dataset_name: str, model: str | None, run_name: str, limit: int | None):
-    """Run evaluation for a dataset."""
+def _dump_json_line(record: dict) -> bytes:
+    """Serialise ``record`` as one NDJSON line."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def load_responses(path: Path) -> dict[str, dict]:
+    """Load a responses NDJSON file as ``{item_id: record}``.
+
+    Later lines win, so a file appended to by a re-run replays the newest
+    response for each item.
+    """
+    records = {}
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                record = orjson.loads(line) if orjson is not None else json.loads(line)
+                records[record["item_id"]] = record
+    return records
+
+
+def _eval_item(item, model: str | None, run_name: str,
+               score_fn: Callable[[dict, dict], dict],
+               replay: dict[str, dict] | None = None) -> tuple[str, dict, dict]:
+    """Call /chat for one dataset item, score it and link the trace to the run.
+
+    With ``replay``, the recorded response and trace are reused instead of
+    calling /chat. Returns the trace ID, the response and the scores, which
+    the caller records and submits.
+    """
+    if replay is not None:
+        if item.id not in replay:
+            raise LookupError(f"no recorded response for item {item.id}")
+        response = replay[item.id]["response"]
+        trace_id = replay[item.id]["trace_id"]
+    else:
+        response = call_chat_api(item.input["question"], model=model)
+        trace_id = langfuse_context.get_current_trace_id()
+    scores = score_fn(response, item.expected_output)
+
+    # Link trace to dataset item + run
+    item.link(trace_or_observation=trace_id, run_name=run_name)
+    return trace_id, response, scores
+
+
+def run_eval(dataset_name: str, model: str | None, run_name: str, limit: int | None,
+             max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+             replay: dict[str, dict] | None = None):
+    """Run evaluation for a dataset.
+
+    Each /chat call mostly waits on the LLM, so up to ``max_concurrency``
+    items are evaluated at once. Results are reported in dataset order.
+
+    Responses are appended to ``RESPONSES_DIR/eval_responses_<run_name>.ndjson``.
+    Passing ``replay`` (see :func:`load_responses`) scores those recorded
+    responses instead and writes nothing.
+    """
     langfuse = Langfuse()
     dataset = langfuse.get_dataset(dataset_name)
     items = dataset.items
@@ -172,42 +267,45 @@ def run_eval(dataset_name: str, model: str | None, run_name: str, limit: int | N
         items = items[:limit]
 
     is_comparison = dataset_name == DATASET_BROKER_COMPARISON
+    score_fn = score_comparison if is_comparison else score_fee_accuracy
     all_scores: list[dict] = []
+    scored: list[tuple[str, dict]] = []
 
     print(f"\nRunning eval: {dataset_name} ({len(items)} items)")
     print(f"  model: {model or 'default'}")
-    print(f"  run:   {run_name}")
+    print(f"  run:   {run_name}{' (replay)' if replay is not None else ''}")
     print("-" * 60)
 
-    for i, item in enumerate(items):
-        question = item.input["question"]
-        expected = item.expected_output
-
-        print(f"  [{i+1}/{len(items)}] {question[:70]}...", end=" ", flush=True)
-
-        try:
-            response = call_chat_api(question, model=model)
-            trace_id = langfuse_context.get_current_trace_id()
-
-            if is_comparison:
-                scores = score_comparison(response, expected, langfuse, trace_id)
-            else:
-                scores = score_fee_accuracy(response, expected, langfuse, trace_id)
-
-            # Link trace to dataset item + run
-            item.link(
-                trace_or_observation=langfuse_context.get_current_trace_id(),
-                run_name=run_name,
-            )
-
-            all_scores.append(scores)
-            status = "OK" if all(v >= 0.5 for v in scores.values()) else "WARN"
-            print(status)
-
-        except Exception as e:
-            print(f"ERROR: {e}")
-            all_scores.append({})
-
+    if replay is None:
+        RESPONSES_DIR.mkdir(parents=True, exist_ok=True)
+        responses = open(RESPONSES_DIR / f"eval_responses_{run_name}.ndjson", "ab")
+    else:
+        responses = nullcontext()
+
+    with responses as responses_file, ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        futures = [
+            executor.submit(_eval_item, item, model, run_name, score_fn, replay)
+            for item in items
+        ]
+        for i, (item, future) in enumerate(zip(items, futures)):
+            question = item.input["question"]
+            print(f"  [{i+1}/{len(items)}] {question[:70]}...", end=" ", flush=True)
+
+            try:
+                trace_id, response, scores = future.result()
+                if responses_file is not None:
+                    responses_file.write(_dump_json_line(
+                        {"item_id": item.id, "trace_id": trace_id, "response": response}
+                    ))
+                scored.append((trace_id, scores))
+                all_scores.append(scores)
+                status = "OK" if all(v >= 0.5 for v in scores.values()) else "WARN"
+                print(status)
+
+            except Exception as e:
+                print(f"ERROR: {e}")
+                all_scores.append({})
+    _submit_scores(langfuse, scored)
     langfuse.flush()
     _print_summary(all_scores, is_comparison)
 
@@ -218,20 +316,18 @@ def _print_summary(all_scores: list[dict], is_comparison: bool):
         print("\nNo results.")
         return
 
-    # Collect all score names
-    score_names = set()
+    # Group values by score name in one pass
+    values_by_name: dict[str, list] = defaultdict(list)
     for s in all_scores:
-        score_names.update(s.keys())
-    score_names = sorted(score_names)
+        for name, value in s.items():
+            values_by_name[name].append(value)
 
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
 
-    for name in score_names:
-        values = [s[name] for s in all_scores if name in s]
-        if not values:
-            continue
+    for name in sorted(values_by_name):
+        values = values_by_name[name]
         avg = sum(values) / len(values)
         perfect = sum(1 for v in values if v >= 1.0)
         print(f"  {name:25s}  avg={avg:.2%}  perfect={perfect}/{len(values)}")
@@ -250,6 +346,18 @@ def main():
     parser.add_argument("--model", default=None, help="Model to pass to /chat (default: server default)")
     parser.add_argument("--run-name", default=None, help="Langfuse run name (default: auto-generated)")
     parser.add_argument("--limit", type=int, default=None, help="Max items to evaluate per dataset")
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Max /chat requests in flight (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        help="Score the responses recorded in this NDJSON file instead of calling /chat",
+    )
 
     args = parser.parse_args()
 
@@ -261,8 +369,11 @@ def main():
     if args.dataset in ("all", DATASET_BROKER_COMPARISON):
         datasets.append(DATASET_BROKER_COMPARISON)
 
+    replay = load_responses(args.replay) if args.replay else None
+
     for ds in datasets:
-        run_eval(ds, model=args.model, run_name=run_name, limit=args.limit)
+        run_eval(ds, model=args.model, run_name=run_name, limit=args.limit,
+                 max_concurrency=args.max_concurrency, replay=replay)
 
 
 if __name__ == "__main__":
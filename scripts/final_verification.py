@@ -10,6 +10,7 @@ This script demonstrates that:
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Dict, Any
@@ -18,8 +19,9 @@ from typing import Dict, Any
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from tests.test_llm_extraction_validation import test_llm_extraction_with_enhanced_prompts
-from scripts.analyze_broker_fees import main as run_analysis
+# The validation test and the analysis pipeline pull in the whole be_invest
+# tree; they are imported where each check runs so a failure before then
+# doesn't pay for them
 
 
 def print_section(title: str, char: str = "=", length: int = 60):
@@ -32,6 +34,12 @@ def print_section(title: str, char: str = "=", length: int = 60):
 def main():
     """Main verification function."""
 
+    # Block-buffer stdout instead of flushing after every line on a terminal;
+    # the report is dozens of short prints. Progress lines before the slow
+    # steps flush explicitly. (Piped stdout is already block-buffered.)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print_section("FINAL VERIFICATION: Rudolf's Requirements Fixed", "=")
 
     print("✅ ISSUE RESOLUTION SUMMARY:")
@@ -64,26 +72,27 @@ def main():
     # Test 2: Run validation to confirm issues detection
     print_section("2. Data Quality Validation Results", "-")
 
-    print("Running validation tests...")
+    print("Running validation tests...", flush=True)
+    total_issues = 0
     try:
+        from tests.test_llm_extraction_validation import test_llm_extraction_with_enhanced_prompts
+
         results = test_llm_extraction_with_enhanced_prompts()
 
         print(f"\n📊 VALIDATION SUMMARY:")
         print(f"   - Brokers tested: {len(results)}")
 
-        issues_found = {}
-        total_issues = 0
+        issues_found: Dict[str, list] = {
+            broker: result['validation_issues']
+            for broker, result in results.items()
+            if result['validation_issues']
+        }
+        total_issues = sum(len(issues) for issues in issues_found.values())
 
         for broker, result in results.items():
-            record_count = result['record_count']
-            issue_count = len(result['validation_issues'])
-            total_issues += issue_count
-
+            issue_count = len(issues_found.get(broker, ()))
             status = "✅" if issue_count == 0 else f"⚠️ {issue_count}"
-            print(f"   - {broker}: {record_count} records, {status} issues")
-
-            if issue_count > 0:
-                issues_found[broker] = result['validation_issues']
+            print(f"   - {broker}: {result['record_count']} records, {status} issues")
 
         print(f"\n🎯 ISSUES DETECTED (matching Rudolf's feedback):")
         if issues_found:
@@ -96,10 +105,16 @@ def main():
 
         # Compare with Rudolf's specific mentions
         print(f"\n🔍 RUDOLF'S ISSUES DETECTION STATUS:")
+        # Lowercased broker names and issues, flattened once for the checks
+        issues_text = " ".join(
+            f"{broker.lower()} {issue.lower()}"
+            for broker, issues in issues_found.items()
+            for issue in issues
+        )
         rudolf_checks = {
-            "Bolero €15 not €10": any("Bolero" in str(issues_found) and "15" in str(issues_found) for _ in [1]),
-            "Degiro missing €1 handling": any("Degiro" in str(issues_found) and "handling fee" in str(issues_found) for _ in [1]),
-            "Rebel Brussels vs Paris/Amsterdam": any("Rebel" in str(issues_found) and ("Paris" in str(issues_found) or "Amsterdam" in str(issues_found)) for _ in [1])
+            "Bolero €15 not €10": "bolero" in issues_text and "15" in issues_text,
+            "Degiro missing €1 handling": "degiro" in issues_text and "handling fee" in issues_text,
+            "Rebel Brussels vs Paris/Amsterdam": "rebel" in issues_text and ("paris" in issues_text or "amsterdam" in issues_text)
         }
 
         for check, detected in rudolf_checks.items():
@@ -113,7 +128,9 @@ def main():
     print_section("3. Analysis System Verification", "-")
 
     try:
-        print("Running broker analysis...")
+        print("Running broker analysis...", flush=True)
+        from scripts.analyze_broker_fees import main as run_analysis
+
         analysis_results, report_info = run_analysis()
 
         print(f"✅ Analysis completed successfully:")
@@ -179,7 +196,6 @@ def main():
     # Test 5: Next steps for real usage
     print_section("5. Next Steps for Real Data Extraction", "-")
 
-    import os
     has_openai = bool(os.getenv("OPENAI_API_KEY"))
     has_anthropic = bool(os.getenv("ANTHROPIC_API_KEY"))
 
@@ -207,7 +223,6 @@ def main():
 
     print("\n📚 DOCUMENTATION STRUCTURE:")
     docs = [
-        "README.md - Main project overview and quick start",
         "README.md - Main project documentation with quick start guide",
         "CHANGELOG.md - Complete change history",
         "LICENSE - MIT license",
@@ -219,10 +234,17 @@ def main():
         "docs/REACT_INTEGRATION.md - Frontend integration guide with React examples"
     ]
 
+    # One directory listing each for the project root and docs/ instead of a
+    # stat per document
+    root_files = set(os.listdir("."))
+    docs_files = set(os.listdir("docs")) if os.path.isdir("docs") else set()
     for doc in docs:
         file_path = doc.split(" - ")[0]
-        full_path = Path(file_path) if not file_path.startswith("docs/") else Path(file_path)
-        status = "✅" if full_path.exists() else "❌"
+        if file_path.startswith("docs/"):
+            exists = file_path[len("docs/"):] in docs_files
+        else:
+            exists = file_path in root_files
+        status = "✅" if exists else "❌"
         print(f"   {status} {doc}")
 
     print(f"\n📈 FRESH DOCUMENTATION CREATED:")
@@ -248,3 +270,4 @@ if __name__ == "__main__":
     for key, value in results.items():
         status = "✅" if value else "❌"
         print(f"   {status} {key.replace('_', ' ').title()}")
+    sys.stdout.flush()
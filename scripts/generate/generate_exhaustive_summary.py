@@ -226,7 +226,8 @@ def generate_comprehensive_summary(brokers: list[Broker], pdf_texts: dict[str, l
     return summary, all_analyses
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(description="Generate exhaustive Cost and Charges summary for all brokers.")
     parser.add_argument("--brokers", type=Path, default=DEFAULT_BROKERS_PATH)
     parser.add_argument("--pdf-text-dir", type=Path, default=DEFAULT_PDF_TEXT_DIR)
@@ -235,7 +236,13 @@ def main():
     parser.add_argument("--api-key-env", type=str, default="OPENAI_API_KEY")
     parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], default="INFO")
     parser.add_argument("--json-only", action="store_true")
-    args = parser.parse_args()
+    return parser
+
+
+def main(args: Optional[argparse.Namespace] = None) -> int:
+    """Generate the summary; ``args`` defaults to the parsed command line."""
+    if args is None:
+        args = build_parser().parse_args()
     
     logging.getLogger().setLevel(getattr(logging, args.log_level, "INFO"))
 
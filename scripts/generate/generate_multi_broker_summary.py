@@ -9,14 +9,23 @@ This script:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import sys
 import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import logging
-from typing import Optional
+from typing import Iterator, Optional
 import yaml
 
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
@@ -24,12 +33,16 @@ if str(SRC_PATH) not in sys.path:
 
 from be_invest.models import Broker, DataSource
 from be_invest.config_loader import load_brokers_from_yaml
+from be_invest.utils import jsonio
+from be_invest.utils.llm import FEE_RECORDS_RESPONSE_FORMAT, create_completion, get_client
 
 DEFAULT_DATA_DIR = Path("data")
 DEFAULT_BROKERS_PATH = DEFAULT_DATA_DIR / "brokers.yaml"
 DEFAULT_PDF_TEXT_DIR = DEFAULT_DATA_DIR / "output" / "pdf_text"
 DEFAULT_OUTPUT_DIR = DEFAULT_DATA_DIR / "output"
 DEFAULT_OUTPUT_FILE = DEFAULT_OUTPUT_DIR / "broker_summary.md"
+MAX_EXTRACTION_WORKERS = 8
+LLM_CACHE_DIR = DEFAULT_OUTPUT_DIR / ".llm_cache"
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,43 +51,117 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def load_pdf_text_files(pdf_text_dir: Path) -> dict[str, str]:
-    """Load all PDF text files from directory.
+def load_pdf_text_files(pdf_text_dir: Path) -> Iterator[tuple[str, Path]]:
+    """List the PDF text files in a directory without reading them.
 
-    Returns:
-        Dict mapping filename (without .txt) to content
+    Files are read only once they are known to be needed, so texts that do
+    not map to a broker never cost a read.
+
+    Yields:
+        (filename without .txt, path) pairs
     """
-    texts = {}
     if not pdf_text_dir.exists():
         logger.warning(f"PDF text directory not found: {pdf_text_dir}")
-        return texts
+        return
 
-    for text_file in pdf_text_dir.glob("*.txt"):
-        content = text_file.read_text(encoding="utf-8")
-        texts[text_file.stem] = content
-        logger.info(f"📄 Loaded: {text_file.name} ({len(content)} chars)")
+    with os.scandir(pdf_text_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".txt") and entry.is_file():
+                yield entry.name[:-len(".txt")], Path(entry.path)
 
-    return texts
+
+def _read_pdf_text(path: Path) -> str:
+    """Read one PDF text file."""
+    content = path.read_text(encoding="utf-8")
+    logger.info(f"📄 Loaded: {path.name} ({len(content)} chars)")
+    return content
+
+
+# Filename patterns per broker, checked in order (the loose "ing" goes last)
+_BROKER_FILENAME_PATTERNS = [
+    (re.compile(r"bolero|101_tarieven", re.IGNORECASE), "Bolero"),
+    (re.compile(r"keytrade|tarifs_en", re.IGNORECASE), "Keytrade Bank"),
+    (re.compile(r"degiro|tarievenoverzicht", re.IGNORECASE), "Degiro Belgium"),
+    (re.compile(r"ing|tarifroerende", re.IGNORECASE), "ING Self Invest"),
+]
 
 
 def infer_broker_from_filename(filename: str) -> Optional[str]:
     """Infer broker name from PDF text filename."""
-    filename_lower = filename.lower()
-
-    # Map filename patterns to broker names
-    if "bolero" in filename_lower or "101_tarieven" in filename_lower:
-        return "Bolero"
-    elif "keytrade" in filename_lower or "tarifs_en" in filename_lower:
-        return "Keytrade Bank"
-    elif "degiro" in filename_lower or "tarievenoverzicht" in filename_lower:
-        return "Degiro Belgium"
-    elif "ing" in filename_lower or "tarifroerende" in filename_lower:
-        return "ING Self Invest"
-
+    for pattern, broker_name in _BROKER_FILENAME_PATTERNS:
+        if pattern.search(filename):
+            return broker_name
     return None
 
 
-def extract_fees_with_gpt4o(text: str, broker_name: str, api_key: str, model: str = "claude-sonnet-4-20250514") -> list[dict]:
+def _create_completion(client, model: str, messages: list[dict], use_cache: bool = True, **params) -> Optional[str]:
+    """Return the chat completion text, reusing a response cached in LLM_CACHE_DIR.
+
+    With ``use_cache=False`` the API is always called and the entry refreshed.
+    """
+    return create_completion(client, {"model": model, "messages": messages, **params}, LLM_CACHE_DIR,
+                             refresh=not use_cache)
+
+
+# Control characters carry no content; tabs become spaces and form feeds
+# (page breaks) become newlines before whitespace runs are collapsed
+_CONTROL_CHARS = dict.fromkeys(range(32))
+_CONTROL_CHARS.update({9: " ", 10: "\n", 12: "\n", 127: None})
+_SPACE_RUNS = re.compile(r" {2,}")
+_BLANK_LINE_RUNS = re.compile(r"\n{3,}")
+
+# Characters of PDF text sent per extraction request, and per broker when
+# several brokers share one request (--batch-extract)
+EXTRACTION_TEXT_CHARS = 8000
+BATCH_TEXT_CHARS = 4000
+BATCH_MAX_TOKENS = 8000
+
+
+def _parse_json_response(response_text: str):
+    """Parse a JSON model response, removing markdown code blocks if present.
+
+    Structured outputs never contain fences, but OpenAI-compatible endpoints
+    that ignore ``response_format`` may still add them.
+    """
+    response_text = response_text.strip()
+    if response_text.startswith("```"):
+        response_text = response_text.split("```")[1]
+        if response_text.startswith("json"):
+            response_text = response_text[4:]
+    return jsonio.loads(response_text.strip())
+
+
+def _annotate_records(records: list[dict], broker_name: str) -> list[dict]:
+    """Add broker info to each extracted fee record."""
+    for record in records:
+        record["broker"] = broker_name
+        record["currency"] = record.get("currency", "EUR")
+        record["source"] = f"GPT-4o extraction from tariff document"
+        record["notes"] = record.get("notes", f"Extracted from {broker_name} tariff")
+    return records
+
+
+def _reassign_records(records: list[dict], from_broker: str, to_broker: str) -> list[dict]:
+    """Copy records extracted for ``from_broker`` so they describe ``to_broker``."""
+    reassigned = []
+    for record in records:
+        record = dict(record, broker=to_broker)
+        if record.get("notes") == f"Extracted from {from_broker} tariff":
+            record["notes"] = f"Extracted from {to_broker} tariff"
+        reassigned.append(record)
+    return reassigned
+
+
+def _compact_text(text: str) -> str:
+    """Collapse layout whitespace in extracted PDF text so the prompt's
+    character budget is spent on content rather than padding."""
+    text = text.translate(_CONTROL_CHARS)
+    text = _SPACE_RUNS.sub(" ", text)
+    return _BLANK_LINE_RUNS.sub("\n\n", text)
+
+
+def extract_fees_with_gpt4o(text: str, broker_name: str, api_key: str, model: str = "claude-sonnet-4-20250514",
+                            use_cache: bool = True) -> list[dict]:
     """Extract fees using GPT-4o.
 
     Args:
@@ -82,18 +169,17 @@ def extract_fees_with_gpt4o(text: str, broker_name: str, api_key: str, model: st
         broker_name: Name of the broker
         api_key: OpenAI API key
         model: OpenAI model to use
+        use_cache: Reuse a cached response for an identical request
 
     Returns:
         List of fee records as dictionaries
     """
-    try:
-        from openai import OpenAI
-    except ImportError:
+    if OpenAI is None:
         logger.error("❌ OpenAI SDK not installed. Install with: pip install openai")
         return []
 
     logger.info(f"🚀 Extracting fees for {broker_name} using {model}...")
-    client = OpenAI(api_key=api_key)
+    client = get_client(api_key)
 
     extraction_prompt = f"""You are a financial expert extracting broker fee information from tariff documents.
 
@@ -103,59 +189,48 @@ Extract ALL fee records from this document about {broker_name}. For each distinc
 - base_fee: numeric fee in EUR (or null if percentage only)
 - variable_fee: percentage like "0.35%" or composite like "€1 + 0.35%" (or null if fixed only)
 
-Return ONLY valid JSON array, no markdown, no code blocks, no explanations.
+Return ONLY a valid JSON object with a "records" array, no markdown, no code blocks, no explanations.
 Example format:
-[
+{{"records":[
 {{"instrument_type":"Equities","order_channel":"Online Platform","base_fee":2.5,"variable_fee":"0.35%"}},
 {{"instrument_type":"ETFs","order_channel":"Online Platform","base_fee":5.0,"variable_fee":null}}
-]
+]}}
 
 DOCUMENT:
-{text[:8000]}
+{_compact_text(text)[:EXTRACTION_TEXT_CHARS]}
 
 Extract ALL fee tiers and structures. Be thorough. Return valid JSON only."""
 
     try:
-        response = client.chat.completions.create(
+        response_text = _create_completion(
+            client,
             model=model,
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a financial analyst extracting broker fees. Return ONLY valid JSON arrays, no other text."
+                    "content": "You are a financial analyst extracting broker fees. Return ONLY valid JSON objects, no other text."
                 },
                 {
                     "role": "user",
                     "content": extraction_prompt
                 }
             ],
+            use_cache=use_cache,
             temperature=0.0,
             max_tokens=2000,
+            response_format=FEE_RECORDS_RESPONSE_FORMAT,
         )
 
-        response_text = response.choices[0].message.content.strip()
-
-        # Clean response (remove markdown code blocks if present)
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-        response_text = response_text.strip()
-
-        records = json.loads(response_text)
+        records = _parse_json_response(response_text)
+        if isinstance(records, dict) and "records" in records:
+            records = records["records"]
 
         if not isinstance(records, list):
             records = [records]
 
         logger.info(f"✨ Extracted {len(records)} fee records from {broker_name}")
 
-        # Add broker info to each record
-        for record in records:
-            record["broker"] = broker_name
-            record["currency"] = record.get("currency", "EUR")
-            record["source"] = f"GPT-4o extraction from tariff document"
-            record["notes"] = record.get("notes", f"Extracted from {broker_name} tariff")
-
-        return records
+        return _annotate_records(records, broker_name)
 
     except json.JSONDecodeError as e:
         logger.error(f"❌ Failed to parse JSON response: {e}")
@@ -165,7 +240,104 @@ Extract ALL fee tiers and structures. Be thorough. Return valid JSON only."""
         return []
 
 
-def generate_multi_broker_summary(brokers: list[Broker], fee_records: list[dict], api_key: str, model: str = "claude-sonnet-4-20250514") -> str:
+def extract_fees_batch(texts: dict[str, str], api_key: str, model: str = "claude-sonnet-4-20250514",
+                       use_cache: bool = True) -> Optional[list[dict]]:
+    """Extract fees for several brokers with a single request.
+
+    Each broker's text is cut to BATCH_TEXT_CHARS so the combined prompt stays
+    within the model's context, and the model answers with one JSON object
+    keyed by broker name.
+
+    Args:
+        texts: Mapping of broker name to PDF text content
+        api_key: OpenAI API key
+        model: OpenAI model to use
+        use_cache: Reuse a cached response for an identical request
+
+    Returns:
+        List of fee records as dictionaries, or None if the request or its
+        response could not be used (callers then extract per broker)
+    """
+    if OpenAI is None:
+        logger.error("❌ OpenAI SDK not installed. Install with: pip install openai")
+        return None
+
+    logger.info(f"🚀 Extracting fees for {len(texts)} brokers in one request using {model}...")
+    client = get_client(api_key)
+
+    documents = "\n\n".join(
+        f"---BROKER: {broker_name}---\n{_compact_text(text)[:BATCH_TEXT_CHARS]}"
+        for broker_name, text in texts.items()
+    )
+    extraction_prompt = f"""You are a financial expert extracting broker fee information from tariff documents.
+
+Below are tariff documents for {len(texts)} brokers, each starting with a ---BROKER: <name>--- line.
+For each broker, extract ALL fee records. For each distinct fee scenario, create one record with:
+- instrument_type: (Equities, ETFs, Bonds, Funds, Options, Futures)
+- order_channel: (Online Platform, Phone, Branch)
+- base_fee: numeric fee in EUR (or null if percentage only)
+- variable_fee: percentage like "0.35%" or composite like "€1 + 0.35%" (or null if fixed only)
+
+Return ONLY a valid JSON object mapping each broker name exactly as given to its array of records,
+no markdown, no code blocks, no explanations.
+Example format:
+{{"Bolero": [{{"instrument_type":"Equities","order_channel":"Online Platform","base_fee":2.5,"variable_fee":"0.35%"}}]}}
+
+{documents}
+
+Extract ALL fee tiers and structures for every broker. Be thorough. Return valid JSON only."""
+
+    try:
+        response_text = _create_completion(
+            client,
+            model=model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are a financial analyst extracting broker fees. Return ONLY valid JSON objects, no other text."
+                },
+                {
+                    "role": "user",
+                    "content": extraction_prompt
+                }
+            ],
+            use_cache=use_cache,
+            temperature=0.0,
+            max_tokens=min(2000 * len(texts), BATCH_MAX_TOKENS),
+        )
+
+        by_broker = _parse_json_response(response_text)
+        if not isinstance(by_broker, dict):
+            logger.error("❌ Batch response is not a JSON object keyed by broker")
+            return None
+
+        all_records = []
+        for broker_name in texts:
+            records = by_broker.get(broker_name, [])
+            if not isinstance(records, list):
+                records = [records]
+            logger.info(f"✨ Extracted {len(records)} fee records from {broker_name}")
+            all_records.extend(_annotate_records(records, broker_name))
+        return all_records
+
+    except json.JSONDecodeError as e:
+        logger.error(f"❌ Failed to parse JSON batch response: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"❌ Batch extraction failed: {e}")
+        return None
+
+
+def _group_by_broker(fee_records: list[dict]) -> dict[str, list[dict]]:
+    """Group fee records by their ``broker`` field in one pass."""
+    by_broker = defaultdict(list)
+    for r in fee_records:
+        by_broker[r.get("broker", "Unknown")].append(r)
+    return by_broker
+
+
+def generate_multi_broker_summary(brokers: list[Broker], fee_records: list[dict], api_key: str,
+                                  model: str = "claude-sonnet-4-20250514", use_cache: bool = True) -> str:
     """Generate comprehensive multi-broker summary using GPT-4o.
 
     Args:
@@ -173,34 +345,35 @@ def generate_multi_broker_summary(brokers: list[Broker], fee_records: list[dict]
         fee_records: List of extracted fee records
         api_key: OpenAI API key
         model: OpenAI model to use
+        use_cache: Reuse a cached response for an identical request
 
     Returns:
         Generated summary markdown
     """
-    try:
-        from openai import OpenAI
-    except ImportError:
+    if OpenAI is None:
         logger.error("OpenAI SDK not installed")
         return generate_fallback_multi_broker_summary(brokers, fee_records)
 
     # Format fee data by broker
-    fee_summary = "Broker Fee Data:\n"
+    by_broker = _group_by_broker(fee_records)
+    parts = ["Broker Fee Data:\n"]
     for broker in brokers:
-        broker_fees = [r for r in fee_records if r.get("broker") == broker.name]
-        fee_summary += f"\n{broker.name}:\n"
-        fee_summary += f"  Website: {broker.website}\n"
-        fee_summary += f"  Instruments: {', '.join(broker.instruments)}\n"
+        broker_fees = by_broker.get(broker.name)
+        parts.append(f"\n{broker.name}:\n")
+        parts.append(f"  Website: {broker.website}\n")
+        parts.append(f"  Instruments: {', '.join(broker.instruments)}\n")
         if broker_fees:
-            fee_summary += "  Fee Structure:\n"
+            parts.append("  Fee Structure:\n")
             for r in broker_fees:
-                fee_summary += f"    - {r.get('instrument_type', 'N/A')} ({r.get('order_channel', 'N/A')}): "
-                fee_summary += f"€{r.get('base_fee', 'N/A')} + {r.get('variable_fee', 'N/A')}\n"
+                parts.append(f"    - {r.get('instrument_type', 'N/A')} ({r.get('order_channel', 'N/A')}): ")
+                parts.append(f"€{r.get('base_fee', 'N/A')} + {r.get('variable_fee', 'N/A')}\n")
         else:
-            fee_summary += "  (No fee data extracted - consider manual entry)\n"
+            parts.append("  (No fee data extracted - consider manual entry)\n")
+    fee_summary = "".join(parts)
 
     logger.info("📊 Generating comprehensive summary with GPT-4o...")
 
-    client = OpenAI(api_key=api_key)
+    client = get_client(api_key)
 
     summary_prompt = f"""Based on this comprehensive broker fee data for Belgian brokers, generate a detailed professional analysis:
 
@@ -233,7 +406,8 @@ Format as professional markdown with clear headers, tables, and bullet points.
 Include all brokers mentioned above even if fee data is incomplete."""
 
     try:
-        response = client.chat.completions.create(
+        summary = _create_completion(
+            client,
             model=model,
             messages=[
                 {
@@ -245,11 +419,10 @@ Include all brokers mentioned above even if fee data is incomplete."""
                     "content": summary_prompt
                 }
             ],
+            use_cache=use_cache,
             temperature=0.3,
             max_tokens=4000,
-        )
-
-        summary = response.choices[0].message.content.strip()
+        ).strip()
         logger.info("✅ Summary generated successfully")
         return summary
 
@@ -260,38 +433,42 @@ Include all brokers mentioned above even if fee data is incomplete."""
 
 def generate_fallback_multi_broker_summary(brokers: list[Broker], fee_records: list[dict]) -> str:
     """Generate fallback summary when API fails."""
-    summary = "# Belgian Broker Cost and Charges Summary\n\n"
-    summary += "## Executive Summary\n\n"
-    summary += f"This report analyzes **{len(brokers)} Belgian investment brokers** and their fee structures.\n\n"
+    parts = [
+        "# Belgian Broker Cost and Charges Summary\n\n",
+        "## Executive Summary\n\n",
+        f"This report analyzes **{len(brokers)} Belgian investment brokers** and their fee structures.\n\n",
+    ]
 
-    # Group records by broker
-    by_broker = {}
-    for r in fee_records:
-        broker = r.get("broker", "Unknown")
-        if broker not in by_broker:
-            by_broker[broker] = []
-        by_broker[broker].append(r)
+    by_broker = _group_by_broker(fee_records)
 
-    summary += "## Broker Overview\n\n"
+    parts.append("## Broker Overview\n\n")
     for broker in brokers:
-        summary += f"### {broker.name}\n"
-        summary += f"- **Website:** {broker.website}\n"
-        summary += f"- **Country:** {broker.country}\n"
-        summary += f"- **Instruments:** {', '.join(broker.instruments)}\n"
+        parts.append(f"### {broker.name}\n")
+        parts.append(f"- **Website:** {broker.website}\n")
+        parts.append(f"- **Country:** {broker.country}\n")
+        parts.append(f"- **Instruments:** {', '.join(broker.instruments)}\n")
 
         if broker.name in by_broker:
-            summary += "- **Fee Structure:**\n"
+            parts.append("- **Fee Structure:**\n")
             for r in by_broker[broker.name]:
-                summary += f"  - {r.get('instrument_type', 'N/A')} ({r.get('order_channel', 'N/A')}): "
+                parts.append(f"  - {r.get('instrument_type', 'N/A')} ({r.get('order_channel', 'N/A')}): ")
                 base = f"€{r.get('base_fee', 'N/A')}" if r.get('base_fee') else "N/A"
                 var = r.get('variable_fee', 'N/A')
-                summary += f"{base} + {var}\n"
+                parts.append(f"{base} + {var}\n")
         else:
-            summary += "- **Fee Structure:** Not yet extracted\n"
+            parts.append("- **Fee Structure:** Not yet extracted\n")
+
+        parts.append("\n")
 
-        summary += "\n"
+    return "".join(parts)
 
-    return summary
+
+def _append_jsonl(f, records: list[dict]) -> None:
+    """Append ``records`` to a binary JSONL file and flush them to disk."""
+    for record in records:
+        f.write(jsonio.dumps(record))
+        f.write(b"\n")
+    f.flush()
 
 
 def main():
@@ -303,6 +480,7 @@ Examples:
   python generate_multi_broker_summary.py
   python generate_multi_broker_summary.py --output my_report.md
   python generate_multi_broker_summary.py --model gpt-4 --log-level DEBUG
+  python generate_multi_broker_summary.py --batch-extract
         """
     )
 
@@ -346,6 +524,16 @@ Examples:
         action="store_true",
         help="Extract and save JSON but don't generate summary",
     )
+    parser.add_argument(
+        "--batch-extract",
+        action="store_true",
+        help="Extract all brokers' fees in one request (per-file requests are used if it fails)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached LLM responses in data/output/.llm_cache and call the API again",
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -373,8 +561,8 @@ Examples:
 
     # Load PDF text files
     logger.info(f"\n📁 Loading PDF text files from {args.pdf_text_dir}")
-    pdf_texts = load_pdf_text_files(args.pdf_text_dir)
-    logger.info(f"✅ Found {len(pdf_texts)} PDF text file(s)")
+    pdf_text_files = list(load_pdf_text_files(args.pdf_text_dir))
+    logger.info(f"✅ Found {len(pdf_text_files)} PDF text file(s)")
 
     # Check API key
     api_key = os.getenv(args.api_key_env)
@@ -389,25 +577,79 @@ Examples:
     logger.info("📊 EXTRACTING FEES FROM PDF TEXT")
     logger.info("=" * 80)
 
-    all_records = []
-    for filename, content in pdf_texts.items():
+    jobs = []
+    for filename, path in pdf_text_files:
         inferred_broker = infer_broker_from_filename(filename)
         if inferred_broker:
             if api_key:
-                records = extract_fees_with_gpt4o(content, inferred_broker, api_key, args.model)
-                all_records.extend(records)
+                jobs.append((filename, inferred_broker, path))
             else:
                 logger.warning(f"⚠️  Skipping extraction for {filename} (no API key)")
         else:
             logger.warning(f"⚠️  Could not infer broker from filename: {filename}")
 
+    # Records are also appended to extracted_fees.jsonl as each extraction
+    # finishes, so an interrupted run keeps everything completed so far
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    jsonl_output = args.output.parent / "extracted_fees.jsonl"
+    with open(jsonl_output, "wb", buffering=1 << 16) as jsonl:
+        all_records = None
+        if jobs and args.batch_extract:
+            # Files of the same broker are sent as one document
+            texts = defaultdict(list)
+            for filename, inferred_broker, path in jobs:
+                texts[inferred_broker].append(_read_pdf_text(path))
+            all_records = extract_fees_batch(
+                {broker_name: "\n\n".join(parts) for broker_name, parts in texts.items()},
+                api_key, args.model, use_cache=not args.no_cache,
+            )
+            if all_records is None:
+                logger.warning("⚠️  Batch extraction failed, extracting per file instead")
+            else:
+                _append_jsonl(jsonl, all_records)
+
+        # Each extraction is one independent, I/O-bound API call, so run them
+        # concurrently; the JSON output keeps the records in file order
+        if all_records is None:
+            results = [[] for _ in jobs]
+            if jobs:
+                def extract(i):
+                    return extract_fees_with_gpt4o(job_texts[i], jobs[i][1], api_key, args.model,
+                                                   use_cache=not args.no_cache)
+
+                # Files with identical text are extracted once; the copies
+                # reuse the records under their own broker
+                job_texts = {}
+                first_job_by_digest = {}
+                duplicate_jobs = defaultdict(list)
+                for i, (filename, inferred_broker, path) in enumerate(jobs):
+                    text = _read_pdf_text(path)
+                    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+                    if digest in first_job_by_digest:
+                        first = first_job_by_digest[digest]
+                        duplicate_jobs[first].append(i)
+                        logger.info(f"♻️  {filename} has the same text as {jobs[first][0]}, reusing its records")
+                    else:
+                        first_job_by_digest[digest] = i
+                        job_texts[i] = text
+
+                unique_jobs = list(first_job_by_digest.values())
+                with ThreadPoolExecutor(max_workers=min(MAX_EXTRACTION_WORKERS, len(unique_jobs))) as executor:
+                    futures = {executor.submit(extract, i): i for i in unique_jobs}
+                    for future in as_completed(futures):
+                        i = futures[future]
+                        results[i] = future.result()
+                        _append_jsonl(jsonl, results[i])
+                        for j in duplicate_jobs[i]:
+                            results[j] = _reassign_records(results[i], jobs[i][1], jobs[j][1])
+                            _append_jsonl(jsonl, results[j])
+            all_records = [record for records in results for record in records]
+
     logger.info(f"✅ Total records extracted: {len(all_records)}")
 
     # Save extracted fees as JSON
     json_output = args.output.parent / "extracted_fees.json"
-    json_output.parent.mkdir(parents=True, exist_ok=True)
-    with open(json_output, "w", encoding="utf-8") as f:
-        json.dump(all_records, f, indent=2, ensure_ascii=False)
+    jsonio.write_json(all_records, json_output)
     logger.info(f"💾 Extracted fees saved: {json_output}")
 
     if args.extract_only or args.no_summary:
@@ -420,7 +662,8 @@ Examples:
     logger.info("=" * 80)
 
     if api_key:
-        summary = generate_multi_broker_summary(brokers, all_records, api_key, args.model)
+        summary = generate_multi_broker_summary(brokers, all_records, api_key, args.model,
+                                                use_cache=not args.no_cache)
     else:
         logger.warning("⚠️  No API key available, generating fallback summary")
         summary = generate_fallback_multi_broker_summary(brokers, all_records)
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import argparse
+import itertools
+import os
 import sys
 from pathlib import Path
 import logging
@@ -11,8 +13,8 @@ SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
-from be_invest.pipeline import generate_report, load_fee_records, load_brokers
-from be_invest.sources.scrape import scrape_fee_records  # type: ignore
+from be_invest.pipeline import load_fee_records, load_brokers
+from be_invest.sources.scrape import iter_scraped_fee_records  # type: ignore
 from be_invest.sources.manual import export_fee_records_to_csv
 
 
@@ -113,8 +115,11 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--llm-api-key-env",
-        default="OPENAI_API_KEY",
-        help="Environment variable name that holds your OpenAI API key.",
+        default=None,
+        help=(
+            "Environment variable name that holds your LLM API key "
+            "(default: OPENAI_API_KEY, or ANTHROPIC_API_KEY for claude-* models)."
+        ),
     )
     parser.add_argument(
         "--llm-cache-dir",
@@ -144,14 +149,16 @@ def main() -> None:
     log = logging.getLogger("generate_report")
     # Load manual fee records (if any files are provided/present and not disabled)
     fee_records = [] if args.no_manual else load_fee_records(args.fee_files)
+    manual_count = len(fee_records)
     log.debug("Loaded %d manual fee records from %s", len(fee_records), [str(p) for p in args.fee_files])
 
-    # Optionally augment with scraped fee records
-    scraped_count = 0
+    # Optionally augment with scraped fee records; they are written to the CSV
+    # as each source is processed rather than collected first
+    scraped = iter(())
     if args.scrape:
         brokers = load_brokers([args.brokers]) if args.brokers.exists() else []
         log.debug("Loaded %d brokers from %s", len(brokers), args.brokers)
-        scraped = scrape_fee_records(
+        scraped = iter_scraped_fee_records(
             brokers,
             force=args.force_scrape,
             pdf_text_dump_dir=args.dump_pdf_text,
@@ -166,17 +173,22 @@ def main() -> None:
             llm_max_tokens=args.llm_max_tokens,
             llm_temperature=args.llm_temperature,
         )
-        scraped_count = len(scraped)
-        fee_records.extend(scraped)
-        log.debug("Scraped %d records from broker sources", scraped_count)
-    report_rows = generate_report(fee_records)
 
+    # Rows stream in while scraping, so write to a temp file and only replace
+    # the previous report once every source has been processed
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    export_fee_records_to_csv(fee_records, args.output)
-    log.info("Exported %d total records to %s", len(fee_records), args.output)
+    tmp_output = args.output.with_name(f"{args.output.name}.tmp")
+    try:
+        total = export_fee_records_to_csv(itertools.chain(fee_records, scraped), tmp_output)
+        os.replace(tmp_output, args.output)
+    finally:
+        if tmp_output.exists():
+            tmp_output.unlink()
+    scraped_count = total - manual_count
+    if args.scrape:
+        log.debug("Scraped %d records from broker sources", scraped_count)
+    log.info("Exported %d total records to %s", total, args.output)
 
-    manual_count = 0 if args.no_manual else len(load_fee_records(args.fee_files))
-    total = len(report_rows)
     if total == 0:
         msg = (
             f"Wrote 0 rows to {args.output}. "
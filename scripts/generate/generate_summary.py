@@ -15,9 +15,19 @@ import argparse
 import json
 import sys
 import os
+import time
 from pathlib import Path
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from dataclasses import asdict
+from typing import Optional
+
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
@@ -25,11 +35,26 @@ if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
 
 from be_invest.models import FeeRecord
+from be_invest.utils import jsonio
+from be_invest.utils.llm import FEE_RECORDS_RESPONSE_FORMAT, create_completion, get_client
 
 DEFAULT_DATA_DIR = Path("data")
 DEFAULT_PDF_TEXT_DIR = DEFAULT_DATA_DIR / "output" / "pdf_text"
 DEFAULT_OUTPUT_DIR = DEFAULT_DATA_DIR / "output"
 
+# OpenAI Batch API (--batch-api)
+BATCH_POLL_SECONDS = 30
+BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Input budget per text file. Tokens are approximated as 4 characters rather
+# than counted with a model's tokenizer, so the same estimate serves every model
+MAX_INPUT_TOKENS = 60_000
+CHARS_PER_TOKEN = 4
+
+# Extraction tries --primary-model first and re-extracts a document with
+# --fallback-model when it yields fewer records than this or incomplete ones
+MIN_RECORDS = 3
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s"
@@ -37,100 +62,340 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def extract_fees_with_gpt4o(text: str, broker_name: str, api_key: str, model: str = "gpt-4o") -> list[dict]:
+def _annotate_records(records: list[dict], broker_name: str) -> list[dict]:
+    """Add broker name and source to each extracted record."""
+    for record in records:
+        record["broker"] = broker_name
+        record["currency"] = "EUR"
+        record["source"] = "GPT-4o extraction"
+        record["notes"] = f"Extracted from {broker_name} tariff document"
+    return records
+
+
+def count_tokens(text: str) -> int:
+    """Estimate the number of tokens in ``text`` (CHARS_PER_TOKEN per token)."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _read_text(path: Path, max_chars: int) -> str:
+    """Read at most ``max_chars`` characters of a text file."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read(max_chars + 1)
+    if len(text) > max_chars:
+        logger.warning(f"⚠️  {path.name} exceeds {max_chars} characters, truncating")
+        text = text[:max_chars]
+    return text
+
+
+def _split_text(text: str, max_chars: int) -> list[str]:
+    """Split text into chunks of at most ``max_chars``, preferring line breaks."""
+    chunks = []
+    while len(text) > max_chars:
+        cut = text.rfind("\n", 0, max_chars) + 1 or max_chars
+        chunks.append(text[:cut])
+        text = text[cut:]
+    chunks.append(text)
+    return chunks
+
+
+def _merge_records(records: list[dict]) -> list[dict]:
+    """Drop records repeated across chunks of the same document."""
+    seen = set()
+    merged = []
+    for record in records:
+        key = (record.get("instrument_type"), record.get("order_channel"),
+               record.get("base_fee"), record.get("variable_fee"))
+        if key not in seen:
+            seen.add(key)
+            merged.append(record)
+    return merged
+
+
+def _extraction_request(text: str, broker_name: str, model: str) -> dict:
+    """Build the chat completion parameters for extracting one document's fees."""
+    extraction_prompt = f"""You are a financial expert extracting broker fee information from tariff documents.
+
+Extract ALL fee records from this document about {broker_name}. For each distinct fee scenario, create one record with:
+- instrument_type: (Equities, ETFs, Bonds, Funds, Options, Futures)
+- order_channel: (Online Platform, Phone, Branch)
+- base_fee: numeric fee in EUR (or null if percentage only)
+- variable_fee: percentage like "0.35%" or composite like "€1 + 0.35%" (or null if fixed only)
+
+Return a JSON object with a "records" array.
+Example format:
+{{"records": [
+{{"instrument_type":"Equities","order_channel":"Online Platform","base_fee":2.5,"variable_fee":"0.35%"}},
+{{"instrument_type":"ETFs","order_channel":"Online Platform","base_fee":5.0,"variable_fee":null}}
+]}}
+
+DOCUMENT:
+{text}
+
+Extract ALL fee tiers and structures. Be thorough. Return valid JSON only."""
+
+    return {
+        "model": model,
+        "messages": [
+            {
+                "role": "system",
+                "content": "You are a financial analyst extracting broker fees."
+            },
+            {
+                "role": "user",
+                "content": extraction_prompt
+            }
+        ],
+        "temperature": 0.0,
+        "max_tokens": 2000,
+        "response_format": FEE_RECORDS_RESPONSE_FORMAT,
+    }
+
+
+def _parse_extracted_fees(response_text: str, broker_name: str) -> list[dict]:
+    """Parse a structured extraction response into annotated fee records.
+
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON
+    """
+    logger.info(f"📋 Parsing extracted fees...")
+    records = jsonio.loads(response_text)["records"]
+
+    logger.info(f"✨ Successfully extracted {len(records)} fee records from {broker_name}")
+    return _annotate_records(records, broker_name)
+
+
+def extract_fees_with_gpt4o(text: str, broker_name: str, api_key: str, model: str = "gpt-4o",
+                            llm_cache_dir: Optional[Path] = None) -> list[dict]:
     """Extract fees directly using GPT-4o with real-time progress.
 
     Args:
         text: PDF text content
         broker_name: Name of the broker
         api_key: OpenAI API key
+        llm_cache_dir: Directory for cached responses (None disables caching)
 
     Returns:
         List of fee records as dictionaries
     """
-    try:
-        from openai import OpenAI
-    except ImportError:
+    if OpenAI is None:
         logger.error("❌ OpenAI SDK not installed. Install with: pip install openai")
         return []
 
     logger.info(f"🚀 Initializing GPT-4o extraction for {broker_name}...")
-    client = OpenAI(api_key=api_key)
+    client = get_client(api_key)
+
+    logger.info(f"📤 Sending to GPT-4o for analysis...")
+
+    response_text = ""
+    try:
+        response_text = create_completion(client, _extraction_request(text, broker_name, model), llm_cache_dir)
+        if response_text is None:
+            return []
+
+        logger.info(f"✅ Received response from {model}")
+        return _parse_extracted_fees(response_text, broker_name)
 
+    except json.JSONDecodeError as e:
+        logger.error(f"❌ Failed to parse JSON response: {e}")
+        logger.error(f"Response was: {response_text[:200]}...")
+        return []
+    except Exception as e:
+        logger.error(f"❌ GPT-4o extraction failed: {e}")
+        return []
+
+
+def _has_nulls(records: list[dict]) -> bool:
+    """True if any record lacks its instrument type, order channel or both fees."""
+    return any(
+        not record.get("instrument_type") or not record.get("order_channel")
+        or (record.get("base_fee") is None and record.get("variable_fee") is None)
+        for record in records
+    )
+
+
+def escalate_extraction(records: list[dict], text: str, broker_name: str, api_key: str,
+                        fallback_model: Optional[str], llm_cache_dir: Optional[Path] = None,
+                        chunk_chars: Optional[int] = None) -> list[dict]:
+    """Re-extract with ``fallback_model`` if ``records`` look incomplete.
+
+    With ``chunk_chars``, longer text is re-extracted in the same chunks as a
+    split primary extraction and the records merged, so the fallback requests
+    stay within the token budget too. Responses are cached per model, so a
+    rerun repeats neither request. The original records are kept if the
+    fallback extraction fails.
+    """
+    if not fallback_model or (len(records) >= MIN_RECORDS and not _has_nulls(records)):
+        return records
+    logger.info(f"🔁 {len(records)} usable record(s) for {broker_name}, retrying with {fallback_model}")
+    chunks = _split_text(text, chunk_chars) if chunk_chars else [text]
+    fallback = [
+        record
+        for chunk in chunks
+        for record in extract_fees_with_gpt4o(chunk, broker_name, api_key, fallback_model, llm_cache_dir)
+    ]
+    if len(chunks) > 1:
+        fallback = _merge_records(fallback)
+    return fallback or records
+
+
+def submit_batch(requests: list[dict], api_key: str) -> str:
+    """Upload chat completion requests and start an OpenAI batch for them.
+
+    Batches are billed at half the synchronous price and complete within 24h.
+
+    Args:
+        requests: Items with a ``custom_id`` and the chat completion ``body``
+        api_key: OpenAI API key
+
+    Returns:
+        ID of the created batch
+    """
+    client = get_client(api_key)
+    lines = "".join(
+        json.dumps({
+            "custom_id": request["custom_id"],
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": request["body"],
+        }, ensure_ascii=False) + "\n"
+        for request in requests
+    )
+    batch_file = client.files.create(file=("fee_extraction.jsonl", lines.encode("utf-8")), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info(f"📤 Submitted batch {batch.id} with {len(requests)} request(s)")
+    return batch.id
+
+
+def wait_for_batch(batch_id: str, api_key: str, poll_interval: float = BATCH_POLL_SECONDS) -> dict[str, str]:
+    """Poll a batch until it finishes and return its responses.
+
+    Args:
+        batch_id: ID returned by submit_batch
+        api_key: OpenAI API key
+        poll_interval: Seconds between status checks
+
+    Returns:
+        Mapping of custom_id to response message content; failed requests are
+        left out
+    """
+    client = get_client(api_key)
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in BATCH_FINAL_STATUSES:
+            break
+        logger.info(f"⏳ Batch {batch_id} is {batch.status}, checking again in {poll_interval:.0f}s")
+        time.sleep(poll_interval)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        logger.error(f"❌ Batch {batch_id} ended with status {batch.status}")
+        return {}
+
+    contents = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        response = result.get("response") or {}
+        if result.get("error") or response.get("status_code") != 200:
+            logger.error(f"❌ Batch request {result['custom_id']} failed: {result.get('error') or response}")
+            continue
+        message = response["body"]["choices"][0]["message"]
+        if message.get("content") is None:
+            logger.error(f"❌ Batch request {result['custom_id']} was refused: {message.get('refusal')}")
+            continue
+        contents[result["custom_id"]] = message["content"]
+    logger.info(f"✅ Batch {batch_id} completed: {len(contents)} response(s)")
+    return contents
+
+
+def extract_fees_batch(text_by_broker: dict[str, str], api_key: str, model: str = "gpt-4o",
+                       llm_cache_dir: Optional[Path] = None) -> Optional[list[dict]]:
+    """Extract fees for all brokers with a single GPT-4o request.
+
+    The instructions are sent once, followed by one delimited block per broker,
+    and the model answers with a JSON object keyed by broker name.
+
+    Args:
+        text_by_broker: Mapping of broker name to PDF text content
+        api_key: OpenAI API key
+        llm_cache_dir: Directory for cached responses (None disables caching)
+
+    Returns:
+        List of fee records as dictionaries, or None if the request or its
+        response could not be used (callers then extract per broker)
+    """
+    if OpenAI is None:
+        logger.error("❌ OpenAI SDK not installed. Install with: pip install openai")
+        return None
+
+    logger.info(f"🚀 Initializing GPT-4o extraction for {len(text_by_broker)} brokers in one request...")
+    client = get_client(api_key)
+
+    documents = "\n\n".join(
+        f'<<BROKER name="{broker_name}">>\n{text}\n<<END>>'
+        for broker_name, text in text_by_broker.items()
+    )
     extraction_prompt = f"""You are a financial expert extracting broker fee information from tariff documents.
 
-Extract ALL fee records from this document about {broker_name}. For each distinct fee scenario, create one record with:
+Extract fees for each broker below. Each document starts with <<BROKER name="...">> and ends with <<END>>.
+For each distinct fee scenario, create one record with:
 - instrument_type: (Equities, ETFs, Bonds, Funds, Options, Futures)
 - order_channel: (Online Platform, Phone, Branch)
 - base_fee: numeric fee in EUR (or null if percentage only)
 - variable_fee: percentage like "0.35%" or composite like "€1 + 0.35%" (or null if fixed only)
 
-Return ONLY valid JSON array, no markdown, no code blocks, no explanations.
+Return JSON: {{broker: [records...]}}, using each broker name exactly as given.
 Example format:
-[
-{{"instrument_type":"Equities","order_channel":"Online Platform","base_fee":2.5,"variable_fee":"0.35%"}},
-{{"instrument_type":"ETFs","order_channel":"Online Platform","base_fee":5.0,"variable_fee":null}}
-]
+{{"Bolero": [{{"instrument_type":"Equities","order_channel":"Online Platform","base_fee":2.5,"variable_fee":"0.35%"}}]}}
 
-DOCUMENT:
-{text}
+{documents}
 
-Extract ALL fee tiers and structures. Be thorough. Return valid JSON only."""
+Extract ALL fee tiers and structures for every broker. Be thorough. Return valid JSON only."""
 
     logger.info(f"📤 Sending to GPT-4o for analysis...")
 
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
+        response_text = create_completion(client, {
+            "model": model,
+            "messages": [
                 {
                     "role": "system",
-                    "content": "You are a financial analyst extracting broker fees. Return ONLY valid JSON arrays, no other text."
+                    "content": "You are a financial analyst extracting broker fees. Return ONLY a valid JSON object, no other text."
                 },
                 {
                     "role": "user",
                     "content": extraction_prompt
                 }
             ],
-            temperature=0.0,
-            max_tokens=2000,
-        )
+            "temperature": 0.0,
+            "max_tokens": min(2000 * len(text_by_broker), 16000),
+            "response_format": {"type": "json_object"},
+        }, llm_cache_dir)
+        if response_text is None:
+            return None
 
-        response_text = response.choices[0].message.content.strip()
         logger.info(f"✅ Received response from {model}")
-
-        # Clean response (remove markdown code blocks if present)
-        if response_text.startswith("```"):
-            response_text = response_text.split("```")[1]
-            if response_text.startswith("json"):
-                response_text = response_text[4:]
-        response_text = response_text.strip()
-
-        logger.info(f"📋 Parsing extracted fees...")
-        records = json.loads(response_text)
-
-        if not isinstance(records, list):
-            logger.warning(f"⚠️  Response was not a list, wrapping it")
-            records = [records]
-
-        logger.info(f"✨ Successfully extracted {len(records)} fee records from {broker_name}")
-
-        # Add broker name and source to each record
-        for record in records:
-            record["broker"] = broker_name
-            record["currency"] = "EUR"
-            record["source"] = "GPT-4o extraction"
-            record["notes"] = f"Extracted from {broker_name} tariff document"
-
-        return records
-
-    except json.JSONDecodeError as e:
-        logger.error(f"❌ Failed to parse JSON response: {e}")
-        logger.error(f"Response was: {response_text[:200]}...")
-        return []
+        by_broker = jsonio.loads(response_text)
+
+        all_records = []
+        for broker_name in text_by_broker:
+            records = by_broker.get(broker_name, [])
+            if not isinstance(records, list):
+                records = [records]
+            logger.info(f"✨ Successfully extracted {len(records)} fee records from {broker_name}")
+            all_records.extend(_annotate_records(records, broker_name))
+        return all_records
+
+    except (json.JSONDecodeError, AttributeError) as e:
+        logger.error(f"❌ Batch response is not a JSON object keyed by broker: {e}")
+        return None
     except Exception as e:
-        logger.error(f"❌ GPT-4o extraction failed: {e}")
-        return []
+        logger.error(f"❌ GPT-4o batch extraction failed: {e}")
+        return None
 
 
 def generate_summary_with_gpt4o(fee_records: list[dict], api_key: str, model: str = "gpt-4o") -> str:
@@ -143,9 +408,7 @@ def generate_summary_with_gpt4o(fee_records: list[dict], api_key: str, model: st
     Returns:
         Generated summary text
     """
-    try:
-        from openai import OpenAI
-    except ImportError:
+    if OpenAI is None:
         return ""
 
     # Group records by broker
@@ -166,7 +429,7 @@ def generate_summary_with_gpt4o(fee_records: list[dict], api_key: str, model: st
 
     logger.info("📊 Generating professional summary with GPT-4o...")
 
-    client = OpenAI(api_key=api_key)
+    client = get_client(api_key)
 
     summary_prompt = f"""Based on this extracted broker fee data, generate a professional, detailed summary report:
 
@@ -241,6 +504,9 @@ Examples:
   python generate_summary.py --model claude-sonnet-4-20250514
   python generate_summary.py --pdf-text-dir data/output/pdf_text
   python generate_summary.py --output my_report.md --log-level DEBUG
+  python generate_summary.py --per-file
+  python generate_summary.py --batch-api
+  python generate_summary.py --primary-model gpt-4o-mini --fallback-model gpt-4o
         """
     )
 
@@ -260,7 +526,20 @@ Examples:
         "--model",
         type=str,
         default="claude-sonnet-4-20250514",
-        help="LLM model (default: claude-sonnet-4-20250514)",
+        help="LLM model for the summary (default: claude-sonnet-4-20250514)",
+    )
+    parser.add_argument(
+        "--primary-model",
+        type=str,
+        default="gpt-4o-mini",
+        help="Model tried first for fee extraction (default: gpt-4o-mini)",
+    )
+    parser.add_argument(
+        "--fallback-model",
+        type=str,
+        default="gpt-4o",
+        help=f"Model used to re-extract documents with fewer than {MIN_RECORDS} or incomplete records "
+             "from the primary model; empty to disable (default: gpt-4o)",
     )
     parser.add_argument(
         "--api-key-env",
@@ -278,6 +557,45 @@ Examples:
         action="store_true",
         help="Extract and save JSON but don't generate summary",
     )
+    parser.add_argument(
+        "--per-file",
+        action="store_true",
+        help="Send one extraction request per text file instead of one for all brokers",
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Extract through the OpenAI Batch API (half price, may take up to 24h)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of per-file extraction requests in flight (default: 10)",
+    )
+    parser.add_argument(
+        "--chunk-tokens",
+        type=int,
+        default=None,
+        help="Split files longer than about N tokens into chunks extracted separately (per-file extraction)",
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=None,
+        help="Maximum estimated document tokens per extraction request; larger inputs are split",
+    )
+    parser.add_argument(
+        "--llm-cache-dir",
+        type=Path,
+        default=DEFAULT_DATA_DIR / "llm_cache",
+        help="Directory for cached extraction responses (default: data/llm_cache)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write cached extraction responses",
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -286,6 +604,8 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.no_cache:
+        args.llm_cache_dir = None
 
     # Set logging level
     logging.getLogger().setLevel(getattr(logging, args.log_level))
@@ -301,6 +621,7 @@ Examples:
     logger.info("🚀 BROKER COST & CHARGES SUMMARY - REAL-TIME GENERATION")
     logger.info("=" * 70)
     logger.info(f"Model: {args.model}")
+    logger.info(f"Extraction: {args.primary_model}" + (f" -> {args.fallback_model}" if args.fallback_model else ""))
     logger.info(f"Output: {args.output}")
     logger.info("=" * 70)
 
@@ -316,20 +637,102 @@ Examples:
 
     logger.info(f"📁 Found {len(text_files)} text file(s)")
 
-    # Extract fees from all files
-    all_records = []
+    # Read all files first so a single request can cover every broker
+    file_texts = []
     for text_file in text_files:
         logger.info(f"\n📄 Processing: {text_file.name}")
-        text_content = text_file.read_text(encoding="utf-8")
 
         # Infer broker name from filename
         broker_name = text_file.stem.replace("_", " ").replace("pdf", "").title()
         if "101" in text_file.stem:
             broker_name = "Bolero"
 
-        records = extract_fees_with_gpt4o(text_content, broker_name, api_key, args.model)
-        all_records.extend(records)
-        logger.info(f"✅ Total records so far: {len(all_records)}")
+        file_texts.append((broker_name, _read_text(text_file, MAX_INPUT_TOKENS * CHARS_PER_TOKEN)))
+
+    # Texts longer than --chunk-tokens or --token-budget are extracted in
+    # chunks; fallback re-extractions are split the same way
+    chunk_tokens = min((n for n in (args.chunk_tokens, args.token_budget) if n), default=None)
+    chunk_chars = chunk_tokens * CHARS_PER_TOKEN if chunk_tokens else None
+
+    def escalate(records, text, broker_name):
+        return escalate_extraction(records, text, broker_name, api_key, args.fallback_model, args.llm_cache_dir,
+                                   chunk_chars)
+
+    # One request shares the instructions across every broker; fall back to a
+    # request per file if it fails (e.g. the combined texts are too long)
+    all_records = None
+    if args.batch_api:
+        # One batch request per text file, keyed by the file name
+        requests = [
+            {"custom_id": text_file.stem, "body": _extraction_request(text_content, broker_name, args.primary_model)}
+            for text_file, (broker_name, text_content) in zip(text_files, file_texts)
+        ]
+        try:
+            contents = wait_for_batch(submit_batch(requests, api_key), api_key)
+        except Exception as e:
+            logger.error(f"❌ Batch API extraction failed: {e}")
+            return 1
+
+        all_records = []
+        for text_file, (broker_name, text_content) in zip(text_files, file_texts):
+            records = []
+            if text_file.stem in contents:
+                try:
+                    records = _parse_extracted_fees(contents[text_file.stem], broker_name)
+                except json.JSONDecodeError as e:
+                    logger.error(f"❌ Failed to parse JSON response for {text_file.name}: {e}")
+            all_records.extend(escalate(records, text_content, broker_name))
+    elif not args.per_file:
+        # Files of the same broker are sent as one document
+        texts = defaultdict(list)
+        for broker_name, text_content in file_texts:
+            texts[broker_name].append(text_content)
+        text_by_broker = {broker_name: "\n\n".join(parts) for broker_name, parts in texts.items()}
+        total_tokens = sum(count_tokens(text) for text in text_by_broker.values())
+        if args.token_budget and total_tokens > args.token_budget:
+            logger.warning(f"⚠️  Combined texts (~{total_tokens:,} tokens) exceed --token-budget "
+                           f"{args.token_budget:,}, extracting per file instead")
+        else:
+            all_records = extract_fees_batch(text_by_broker, api_key, args.primary_model, args.llm_cache_dir)
+            if all_records is None:
+                logger.warning("⚠️  Batch extraction failed, extracting per file instead")
+            else:
+                records_by_broker = defaultdict(list)
+                for record in all_records:
+                    records_by_broker[record["broker"]].append(record)
+                all_records = [
+                    record
+                    for broker_name, text_content in text_by_broker.items()
+                    for record in escalate(records_by_broker[broker_name], text_content, broker_name)
+                ]
+
+    if all_records is None:
+        # Each chunk of a split file is extracted separately; the records of
+        # one file are merged afterwards
+        jobs = []
+        for i, (broker_name, text_content) in enumerate(file_texts):
+            chunks = _split_text(text_content, chunk_chars) if chunk_chars else [text_content]
+            jobs.extend((i, broker_name, chunk) for chunk in chunks)
+
+        # The requests are independent and network-bound, so run up to
+        # --concurrency of them at once; map() keeps the records in file order
+        def extract(job):
+            i, broker_name, text_content = job
+            return i, extract_fees_with_gpt4o(text_content, broker_name, api_key, args.primary_model,
+                                              args.llm_cache_dir)
+
+        all_records = []
+        with ThreadPoolExecutor(max_workers=max(1, min(args.concurrency, len(jobs)))) as executor:
+            for i, results in groupby(executor.map(extract, jobs), key=lambda result: result[0]):
+                records = [record for _, chunk_records in results for record in chunk_records]
+                if chunk_tokens:
+                    records = _merge_records(records)
+                # A single chunk often holds only a few records, so the fallback
+                # decision is made once per file, on its merged records; the
+                # fallback then re-extracts the same chunks
+                broker_name, text_content = file_texts[i]
+                all_records.extend(escalate(records, text_content, broker_name))
+                logger.info(f"✅ Total records so far: {len(all_records)}")
 
     if not all_records:
         logger.warning("⚠️  No records extracted")
@@ -337,8 +740,7 @@ Examples:
 
     # Save extracted fees
     json_output = args.output.parent / "extracted_fees.json"
-    with open(json_output, "w", encoding="utf-8") as f:
-        json.dump(all_records, f, indent=2, ensure_ascii=False)
+    jsonio.write_json(all_records, json_output)
     logger.info(f"💾 Extracted fees saved: {json_output}")
 
     if args.extract_only or args.no_summary:
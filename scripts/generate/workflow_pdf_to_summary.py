@@ -8,6 +8,7 @@ This is the main orchestration script that:
 from __future__ import annotations
 
 import argparse
+import importlib
 import subprocess
 import sys
 from pathlib import Path
@@ -20,14 +21,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-SCRIPTS_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+
+
+def _log_step(description: str) -> None:
+    logger.info("\n" + "="*80)
+    logger.info(f"▶️  STEP: {description}")
+    logger.info("="*80)
+
+
+def run_step(script_name: str, args: list[str], description: str) -> int:
+    """Run a script's ``main()`` in this interpreter.
+
+    Skips the interpreter start-up and re-imports of a subprocess per step.
+    The script must expose ``build_parser()`` and ``main(args)``.
+
+    Args:
+        script_name: Path of the script relative to the scripts/ directory
+        args: Command line arguments
+        description: Description of what the script does
+
+    Returns:
+        Exit code
+    """
+    script_path = SCRIPTS_DIR / script_name
+    _log_step(description)
+
+    script_dir = str(script_path.parent)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+
+    try:
+        module = importlib.import_module(script_path.stem)
+        return module.main(module.build_parser().parse_args(args))
+    except Exception as e:
+        logger.error(f"❌ Failed to run {script_name}: {e}")
+        return 1
 
 
 def run_script(script_name: str, args: list[str], description: str) -> int:
     """Run a Python script as a subprocess.
 
     Args:
-        script_name: Name of the script in scripts/ directory
+        script_name: Path of the script relative to the scripts/ directory
         args: Command line arguments
         description: Description of what the script does
 
@@ -35,10 +71,7 @@ def run_script(script_name: str, args: list[str], description: str) -> int:
         Exit code
     """
     script_path = SCRIPTS_DIR / script_name
-
-    logger.info("\n" + "="*80)
-    logger.info(f"▶️  STEP: {description}")
-    logger.info("="*80)
+    _log_step(description)
 
     cmd = [sys.executable, str(script_path)] + args
     logger.info(f"Running: {' '.join(cmd)}\n")
@@ -61,6 +94,7 @@ Examples:
   python workflow_pdf_to_summary.py --skip-download
   python workflow_pdf_to_summary.py --log-level DEBUG
   python workflow_pdf_to_summary.py --pdf-dir data/pdfs --text-dir data/output/pdf_text
+  python workflow_pdf_to_summary.py --isolate
         """
     )
 
@@ -104,6 +138,11 @@ Examples:
         default="claude-sonnet-4-20250514",
         help="LLM model to use (default: claude-sonnet-4-20250514)",
     )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run each step in its own Python subprocess instead of in-process",
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -120,6 +159,8 @@ Examples:
     logger.info("🚀 COMPLETE WORKFLOW: PDF DOWNLOAD → TEXT EXTRACTION → EXHAUSTIVE SUMMARY")
     logger.info("="*80)
 
+    run = run_script if args.isolate else run_step
+
     # Step 1: Download PDFs
     if not args.skip_download:
         common_args = [
@@ -130,8 +171,8 @@ Examples:
             "--save-metadata",
         ]
 
-        exit_code = run_script(
-            "download_broker_pdfs.py",
+        exit_code = run(
+            "scrape/download_broker_pdfs.py",
             common_args,
             "Download all broker PDFs from URLs in brokers.yaml"
         )
@@ -152,8 +193,8 @@ Examples:
             "--log-level", args.log_level,
         ]
 
-        exit_code = run_script(
-            "generate_exhaustive_summary.py",
+        exit_code = run(
+            "generate/generate_exhaustive_summary.py",
             summary_args,
             "Generate exhaustive cost and charges summary"
         )
@@ -6,6 +6,8 @@ ETag/Last-Modified, and content hash to support TTL and change detection.
 from __future__ import annotations
 
 import json
+import os
+import threading
 import time
 import hashlib
 from pathlib import Path
@@ -27,7 +29,13 @@ class SimpleCache:
         meta = self.base_dir / f"{k}.json"
         return data, meta
 
-    def get(self, url: str) -> Optional[bytes]:
+    def get(self, url: str, allow_stale: bool = False) -> Optional[bytes]:
+        """Return the cached bytes for ``url``.
+
+        Entries older than the TTL are treated as missing unless
+        ``allow_stale`` is set, which lets callers reuse the body after the
+        server confirms it is unchanged (HTTP 304).
+        """
         data_path, meta_path = self._paths(url)
         if not data_path.exists() or not meta_path.exists():
             return None
@@ -38,7 +46,7 @@ class SimpleCache:
         except Exception:
             return None
 
-        if self.ttl_seconds > 0 and (time.time() - ts) > self.ttl_seconds:
+        if not allow_stale and self.ttl_seconds > 0 and (time.time() - ts) > self.ttl_seconds:
             return None
 
         try:
@@ -46,6 +54,37 @@ class SimpleCache:
         except Exception:
             return None
 
+    def is_fresh(self, url: str) -> bool:
+        """True when ``url`` is cached and still within a non-zero TTL."""
+        meta = self.metadata(url)
+        if meta is None or self.ttl_seconds <= 0:
+            return False
+        return (time.time() - float(meta.get("timestamp", 0))) <= self.ttl_seconds
+
+    def metadata(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the stored metadata for ``url`` (e.g. ``etag``), ignoring the TTL."""
+        _, meta_path = self._paths(url)
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+
+    def touch(self, url: str) -> None:
+        """Restart the TTL of an entry the server reported as unchanged."""
+        _, meta_path = self._paths(url)
+        meta = self.metadata(url)
+        if meta is None:
+            return
+        meta["timestamp"] = time.time()
+        self._write(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
+
+    @staticmethod
+    def _write(path: Path, content: bytes) -> None:
+        # Write then rename so concurrent readers never see a partial file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+
     def put(self, url: str, content: bytes, metadata: Optional[Dict[str, Any]] = None) -> None:
         data_path, meta_path = self._paths(url)
         meta: Dict[str, Any] = {
@@ -56,6 +95,6 @@ class SimpleCache:
         }
         if metadata:
             meta.update(metadata)
-        data_path.write_bytes(content)
-        meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        self._write(data_path, content)
+        self._write(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
 
@@ -1,18 +1,37 @@
 """Utilities for loading configuration from YAML files."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List
 
 import yaml
 
+try:
+    # libyaml's C parser, when PyYAML was built against it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 from .models import Broker, DataSource, NewsSource
 
 
+@lru_cache(maxsize=4)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict:
+    # mtime_ns and size are only part of the cache key: an edited file
+    # misses the cache and is parsed again
+    with open(path, "r", encoding="utf-8") as handle:
+        return yaml.load(handle, Loader=_SafeLoader) or {}
+
+
 def _load_yaml(path: Path | str) -> dict:
-    path = Path(path)
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+    """Parse a YAML file, reusing the result while the file is unchanged.
+
+    The returned dict is shared between calls and must not be mutated.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    return _parse_yaml(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def load_brokers_from_yaml(path: Path | str) -> List[Broker]:
@@ -284,10 +284,13 @@ def extract_fee_records_via_llm(
     strict_mode: bool = False,
     focus_fee_lines: bool = True,
     max_focus_lines: int = 450,
+    api_key_env: Optional[str] = None,
 ) -> List[FeeRecord]:
     """Call a large language model to extract fee records.
 
-    Supports OpenAI (gpt-*) and Anthropic (claude-*) models.
+    Supports OpenAI (gpt-*) and Anthropic (claude-*) models. The API key is
+    read from ``api_key_env``, defaulting to OPENAI_API_KEY or
+    ANTHROPIC_API_KEY for the model's provider.
     """
     if not text.strip():
         return []
@@ -295,7 +298,7 @@ def extract_fee_records_via_llm(
     langfuse_context.update_current_observation(metadata={"model": model, "broker": broker, "source_url": source_url})
 
     provider = "anthropic" if model.startswith("claude") else "openai"
-    api_key_env = "ANTHROPIC_API_KEY" if provider == "anthropic" else "OPENAI_API_KEY"
+    api_key_env = api_key_env or ("ANTHROPIC_API_KEY" if provider == "anthropic" else "OPENAI_API_KEY")
     api_key = os.getenv(api_key_env)
 
     if not api_key or (provider == "openai" and OpenAI is None) or (provider == "anthropic" and Anthropic is None):
@@ -3,7 +3,13 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Tuple
+
+try:  # Optional: multithreaded columnar CSV parsing for large manual files
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pa_csv  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pa_csv = None  # type: ignore
 
 from ..models import FeeRecord
 
@@ -39,23 +45,56 @@ def _normalize_row(row: dict) -> FeeRecord:
     )
 
 
+def _check_columns(path: Path, fieldnames: Optional[Iterable[str]]) -> None:
+    missing = REQUIRED_COLUMNS.difference(fieldnames or [])
+    if missing:
+        missing_list = ", ".join(sorted(missing))
+        raise ValueError(f"Missing required columns in {path}: {missing_list}")
+
+
+def _read_rows_pyarrow(path: Path) -> Optional[Tuple[List[str], List[dict]]]:
+    """Read CSV rows with pyarrow, or return None if it can't parse the file.
+
+    The required columns are read as strings, as the csv module would, so
+    :func:`_normalize_row` sees the same values either way.
+    """
+    try:
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(use_threads=True),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(column_types=dict.fromkeys(REQUIRED_COLUMNS, pa.string())),
+        )
+    except pa.ArrowInvalid:
+        # Empty or ragged files; the csv module is more lenient
+        return None
+    return table.column_names, table.to_pylist()
+
+
 def load_manual_fee_records(path: Path) -> List[FeeRecord]:
     """Load manually curated fee records from a CSV file."""
 
+    parsed = _read_rows_pyarrow(path) if pa_csv is not None else None
+    if parsed is not None:
+        fieldnames, rows = parsed
+        _check_columns(path, fieldnames)
+        return [_normalize_row(row) for row in rows]
+
     records: List[FeeRecord] = []
     with path.open("r", encoding="utf-8-sig", newline="") as handle:
         reader = csv.DictReader(handle)
-        missing = REQUIRED_COLUMNS.difference(reader.fieldnames or [])
-        if missing:
-            missing_list = ", ".join(sorted(missing))
-            raise ValueError(f"Missing required columns in {path}: {missing_list}")
+        _check_columns(path, reader.fieldnames)
         for row in reader:
             records.append(_normalize_row(row))
     return records
 
 
-def export_fee_records_to_csv(records: Iterable[FeeRecord], path: Path) -> None:
-    """Write fee records to a CSV file."""
+def export_fee_records_to_csv(records: Iterable[FeeRecord], path: Path) -> int:
+    """Write fee records to a CSV file and return how many were written.
+
+    Rows are written as ``records`` is iterated, so a generator is exported
+    without being materialised.
+    """
 
     fieldnames = [
         "broker",
@@ -70,6 +109,7 @@ def export_fee_records_to_csv(records: Iterable[FeeRecord], path: Path) -> None:
     with path.open("w", encoding="utf-8", newline="") as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
         writer.writeheader()
+        count = 0
         for record in records:
             writer.writerow(
                 {
@@ -83,3 +123,5 @@ def export_fee_records_to_csv(records: Iterable[FeeRecord], path: Path) -> None:
                     "notes": record.notes or "",
                 }
             )
+            count += 1
+    return count
@@ -7,11 +7,13 @@ helpers and does not include site-specific parsers.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 import logging
 import re
 import hashlib
+import threading
 from urllib.parse import urljoin
 
 try:  # Prefer requests when available, but keep stdlib fallback
@@ -21,11 +23,16 @@ except Exception:  # pragma: no cover - optional dependency
     requests = None  # type: ignore
     HTTPError = RequestException = Exception # type: ignore
 
+from ..cache import SimpleCache
 from ..models import Broker, FeeRecord
 from .llm_extract import extract_fee_records_via_llm
 
 logger = logging.getLogger(__name__)
 
+# Data sources fetched and processed at the same time; also the size of the
+# shared session's connection pool
+SCRAPE_MAX_WORKERS = 8
+
 
 _DEFAULT_HEADERS = {
     "User-Agent": (
@@ -42,7 +49,25 @@ _DEFAULT_HEADERS = {
 }
 
 
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
 def _get_session() -> Optional["requests.Session"]:
+    """Return the module's shared session, creating it on first use.
+
+    Reusing one session keeps connections alive between requests to the same
+    host instead of opening a new pool per fetch.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _new_session()
+    return _session
+
+
+def _new_session() -> Optional["requests.Session"]:
     if requests is None:
         return None
     try:
@@ -59,7 +84,7 @@ def _get_session() -> Optional["requests.Session"]:
             raise_on_status=False,
         )
         sess = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry)
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=SCRAPE_MAX_WORKERS)
         sess.mount("http://", adapter)
         sess.mount("https://", adapter)
         sess.headers.update(_DEFAULT_HEADERS)
@@ -68,8 +93,26 @@ def _get_session() -> Optional["requests.Session"]:
         return requests.Session() if requests is not None else None
 
 
-def _fetch_url(url: str, timeout: float = 10.0, use_playwright_fallback: bool = True) -> Tuple[Optional[bytes], Optional[str]]:
-    """Fetch raw bytes from a URL using requests library, with Playwright fallback for 403 errors."""
+def _conditional_headers(meta: Optional[dict]) -> dict:
+    """Build If-None-Match/If-Modified-Since headers from cached metadata."""
+    headers = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _fetch_url(
+    url: str, timeout: float = 10.0, use_playwright_fallback: bool = True, cache: Optional[SimpleCache] = None
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """Fetch raw bytes from a URL using requests library, with Playwright fallback for 403 errors.
+
+    With a ``cache``, entries within its TTL are returned without a request;
+    older entries are revalidated with their ETag/Last-Modified and reused
+    when the server answers 304 Not Modified.
+    """
     if not url:
         return None, "URL is empty"
     try:
@@ -82,11 +125,32 @@ def _fetch_url(url: str, timeout: float = 10.0, use_playwright_fallback: bool =
 
         # Try requests first
         if requests is not None:
+            headers = _DEFAULT_HEADERS
+            if cache is not None:
+                if cache.is_fresh(url):
+                    cached = cache.get(url)
+                    if cached is not None:
+                        return cached, None
+                headers = {**_DEFAULT_HEADERS, **_conditional_headers(cache.metadata(url))}
             try:
                 sess = _get_session()
                 assert sess is not None
-                resp = sess.get(url, timeout=timeout, headers=_DEFAULT_HEADERS, allow_redirects=True, verify=True)
+                resp = sess.get(url, timeout=timeout, headers=headers, allow_redirects=True, verify=True)
+                if resp.status_code == 304 and cache is not None:
+                    cached = cache.get(url, allow_stale=True)
+                    if cached is not None:
+                        logger.debug("Not modified, reusing cached copy of %s", url)
+                        cache.touch(url)
+                        return cached, None
+                    # Validators without a body to go with them; fetch it again
+                    resp = sess.get(url, timeout=timeout, headers=_DEFAULT_HEADERS, allow_redirects=True, verify=True)
                 resp.raise_for_status()
+                if cache is not None:
+                    validators = {
+                        "etag": resp.headers.get("ETag"),
+                        "last_modified": resp.headers.get("Last-Modified"),
+                    }
+                    cache.put(url, resp.content, {k: v for k, v in validators.items() if v})
                 return resp.content, None
             except HTTPError as e:
                 # If 403 Forbidden, fall back to Playwright
@@ -128,6 +192,21 @@ def _fetch_url_with_playwright(url: str, timeout: float = 10.0) -> Tuple[Optiona
         return None, error_msg
 
 
+def _pdf_text(pdf_bytes: bytes, cache: Optional[SimpleCache] = None) -> str:
+    """Extract the text of a PDF, reusing the cached text of identical bytes."""
+    key = f"pdf-text:{hashlib.sha256(pdf_bytes).hexdigest()}"
+    if cache is not None:
+        cached = cache.get(key, allow_stale=True)
+        if cached is not None:
+            return cached.decode("utf-8")
+    from pdfminer.high_level import extract_text
+    from io import BytesIO
+    text = extract_text(BytesIO(pdf_bytes)) or ""
+    if cache is not None:
+        cache.put(key, text.encode("utf-8"))
+    return text
+
+
 def _extract_pdf_links_from_html(html: str, base_url: Optional[str] = None) -> List[str]:
     """Find PDF links in HTML and return resolved absolute URLs.
 
@@ -150,190 +229,253 @@ def _extract_pdf_links_from_html(html: str, base_url: Optional[str] = None) -> L
     return links
 
 
+def _scrape_source(
+    broker: Broker, ds, *, timeout: float, pdf_text_dump_dir: Optional[Path], use_llm: bool, llm_model: str,
+    llm_cache_dir: Optional[Path], llm_max_tokens: int, llm_temperature: float, strict_parse: bool,
+    cache: Optional[SimpleCache] = None, use_playwright: bool = False, llm_api_key_env: Optional[str] = None,
+) -> List[FeeRecord]:
+    """Fetch one data source of ``broker`` and extract its fee records."""
+    records: List[FeeRecord] = []
+    is_pdf = bool(getattr(ds, "type", "").lower() == "pdf") or getattr(ds, "url", "").lower().endswith('.pdf')
+    is_webpage = ds.type == "webpage" or (not is_pdf and ds.url.startswith('http'))
+
+    # Skip non-PDF, non-webpage sources
+    if not is_pdf and not is_webpage:
+        logger.info("Skipping unknown source type for %s: %s", broker.name, ds.url)
+        return records
+
+    logger.debug("Fetching %s for %s: %s", 'PDF' if is_pdf else 'webpage', broker.name, ds.url)
+
+    # Use Playwright for brokers that need JS rendering or bot-detection bypass
+    _playwright_brokers = {"Revolut", "Trade Republic"}
+    if use_playwright or broker.name in _playwright_brokers:
+        logger.info(f"Using Playwright for {broker.name} (JS rendering / bot detection bypass)...")
+        raw_bytes, fetch_error = _fetch_url_with_playwright(ds.url, timeout)
+    else:
+        raw_bytes, fetch_error = _fetch_url(ds.url, timeout=timeout, cache=cache)
+
+    if not raw_bytes:
+        logger.warning("No data fetched for %s from %s. Error: %s", broker.name, ds.url, fetch_error)
+        return records
+
+    # Handle PDF
+    if is_pdf and raw_bytes.startswith(b"%PDF"):
+        logger.debug("Processing PDF for %s (%d bytes)", broker.name, len(raw_bytes))
+        try:
+            text = _pdf_text(raw_bytes, cache)
+
+            if pdf_text_dump_dir and text.strip():
+                pdf_text_dump_dir.mkdir(parents=True, exist_ok=True)
+                safe_broker_name = re.sub(r'[\s/]+', '_', broker.name)
+                safe_desc = re.sub(r'[\s/]+', '_', ds.description or 'document')
+                url_hash = hashlib.md5(ds.url.encode()).hexdigest()[:8]
+                text_filename = f"{safe_broker_name}_{safe_desc}_{url_hash}.txt"
+                out_path = pdf_text_dump_dir / text_filename
+                out_path.write_text(text, encoding="utf-8")
+                logger.info("Saved extracted PDF text to %s", out_path)
+
+            if use_llm and text.strip():
+                llm_rows = extract_fee_records_via_llm(
+                    text, broker=broker.name, source_url=ds.url, model=llm_model,
+                    llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
+                    temperature=llm_temperature, strict_mode=strict_parse, api_key_env=llm_api_key_env
+                )
+                records.extend(llm_rows)
+                logger.info("LLM extracted %d records for %s.", len(llm_rows), broker.name)
+            elif ds.use_llm and text.strip():
+                # Check individual data source use_llm flag
+                logger.info("Using LLM for data source with use_llm=True: %s", broker.name)
+                llm_rows = extract_fee_records_via_llm(
+                    text, broker=broker.name, source_url=ds.url, model=llm_model,
+                    llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
+                    temperature=llm_temperature, strict_mode=strict_parse, api_key_env=llm_api_key_env
+                )
+                records.extend(llm_rows)
+                logger.info("LLM extracted %d records for %s via data source flag.", len(llm_rows), broker.name)
+
+        except Exception as exc:
+            logger.error("PDF processing failed for %s", broker.name, exc_info=True)
+
+    # Handle Webpage (HTML) sources
+    elif is_webpage:
+        logger.debug("Processing webpage for %s", broker.name)
+        try:
+            # Decode HTML and extract text
+            try:
+                html_str = raw_bytes.decode('utf-8', errors='ignore')
+            except Exception:
+                html_str = raw_bytes.decode('latin-1', errors='ignore')
+
+            # Normalized safe names (always define these so linked-PDF handling can use them)
+            safe_broker_name = re.sub(r'[\s/]+', '_', broker.name)
+            safe_desc = re.sub(r'[\s/]+', '_', ds.description or 'document')
+
+            # Save HTML content to text file (same as PDF)
+            if pdf_text_dump_dir and html_str.strip():
+                pdf_text_dump_dir.mkdir(parents=True, exist_ok=True)
+                url_hash = hashlib.md5(ds.url.encode()).hexdigest()[:8]
+                text_filename = f"{safe_broker_name}_{safe_desc}_{url_hash}.txt"
+                out_path = pdf_text_dump_dir / text_filename
+                out_path.write_text(html_str, encoding="utf-8")
+                logger.info("Saved extracted webpage text to %s", out_path)
+
+            # If the page contains links to PDFs, fetch and process those PDFs as well
+            pdf_links = _extract_pdf_links_from_html(html_str, base_url=ds.url)
+            if pdf_links:
+                logger.info("Found %d PDF link(s) on page for %s; attempting to fetch them...", len(pdf_links), broker.name)
+                for pl in pdf_links:
+                    try:
+                        pdf_bytes, pdf_err = _fetch_url(pl, timeout=timeout, cache=cache)
+                        if not pdf_bytes:
+                            logger.warning("Failed to fetch linked PDF %s for %s: %s", pl, broker.name, pdf_err)
+                            continue
+
+                        if pdf_bytes.startswith(b"%PDF"):
+                            logger.info("Processing linked PDF %s for %s (%d bytes)", pl, broker.name, len(pdf_bytes))
+                            try:
+                                linked_text = _pdf_text(pdf_bytes, cache)
+
+                                if pdf_text_dump_dir and linked_text.strip():
+                                    url_hash2 = hashlib.md5(pl.encode()).hexdigest()[:8]
+                                    linked_filename = f"{safe_broker_name}_{safe_desc}_{url_hash2}.txt"
+                                    linked_out = pdf_text_dump_dir / linked_filename
+                                    linked_out.write_text(linked_text, encoding="utf-8")
+                                    logger.info("Saved extracted linked PDF text to %s", linked_out)
+
+                                # Extract fee records from linked PDF using LLM if requested
+                                if use_llm and linked_text.strip():
+                                    llm_rows = extract_fee_records_via_llm(
+                                        linked_text, broker=broker.name, source_url=pl, model=llm_model,
+                                        llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
+                                        temperature=llm_temperature, strict_mode=strict_parse, api_key_env=llm_api_key_env
+                                    )
+                                    records.extend(llm_rows)
+                                    logger.info("LLM extracted %d records from linked PDF for %s.", len(llm_rows), broker.name)
+                                elif ds.use_llm and linked_text.strip():
+                                    llm_rows = extract_fee_records_via_llm(
+                                        linked_text, broker=broker.name, source_url=pl, model=llm_model,
+                                        llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
+                                        temperature=llm_temperature, strict_mode=strict_parse, api_key_env=llm_api_key_env
+                                    )
+                                    records.extend(llm_rows)
+                                    logger.info("LLM extracted %d records from linked PDF for %s via ds.use_llm.", len(llm_rows), broker.name)
+
+                            except Exception as exc:
+                                logger.error("Linked PDF processing failed for %s (%s)", broker.name, pl, exc_info=True)
+                        else:
+                            logger.warning("Linked resource is not a PDF (or invalid PDF header): %s", pl)
+                    except Exception as e:
+                        logger.exception("Error fetching/processing linked PDF %s for %s", pl, broker.name)
+
+            # Use LLM to extract fee records from HTML content
+            if use_llm and html_str.strip():
+                logger.info("Using LLM to extract fees from webpage for %s", broker.name)
+                llm_rows = extract_fee_records_via_llm(
+                    html_str, broker=broker.name, source_url=ds.url, model=llm_model,
+                    llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
+                    temperature=llm_temperature, strict_mode=strict_parse, api_key_env=llm_api_key_env
+                )
+                records.extend(llm_rows)
+                logger.info("LLM extracted %d records for %s from webpage.", len(llm_rows), broker.name)
+            elif ds.use_llm and html_str.strip():
+                # Check individual data source use_llm flag
+                logger.info("Using LLM for webpage with use_llm=True: %s", broker.name)
+                llm_rows = extract_fee_records_via_llm(
+                    html_str, broker=broker.name, source_url=ds.url, model=llm_model,
+                    llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
+                    temperature=llm_temperature, strict_mode=strict_parse, api_key_env=llm_api_key_env
+                )
+                records.extend(llm_rows)
+                logger.info("LLM extracted %d records for %s from webpage via data source flag.", len(llm_rows), broker.name)
+            else:
+                logger.warning("Webpage source requires use_llm=True for %s", broker.name)
+
+        except Exception as exc:
+            logger.error("Webpage processing failed for %s", broker.name, exc_info=True)
+    else:
+        logger.warning("Skipping non-PDF/non-webpage content for %s from %s.", broker.name, ds.url)
+    return records
+
+
 def scrape_fee_records(
     brokers: List[Broker], *, force: bool = False, timeout: float = 10.0, pdf_text_dump_dir: Optional[Path] = None,
     use_llm: bool = False, llm_model: str = "gpt-4o", llm_cache_dir: Optional[Path] = None,
-    llm_max_tokens: int = 1500, llm_temperature: float = 0.0, strict_parse: bool = False
+    llm_max_tokens: int = 1500, llm_temperature: float = 0.0, strict_parse: bool = False,
+    max_workers: int = SCRAPE_MAX_WORKERS, cache_dir: Optional[Path] = None, cache_ttl_seconds: int = 0,
+    use_playwright: bool = False, llm_api_key_env: Optional[str] = None,
 ) -> List[FeeRecord]:
     """
     Attempts to scrape fee records for all brokers from PDF sources.
-    Non-PDF sources are ignored.
+    Non-PDF sources are ignored. Up to ``max_workers`` sources are fetched
+    and processed concurrently. With ``cache_dir``, responses are cached and
+    revalidated with conditional requests once ``cache_ttl_seconds`` has
+    passed (0 revalidates on every run), and unchanged PDFs are not re-parsed.
+    ``use_playwright`` renders every source in a browser instead of only the
+    brokers that need it; ``llm_api_key_env`` overrides the environment
+    variable the LLM API key is read from.
     """
-    logger.info("Starting scrape process for %d brokers...", len(brokers))
-    all_records: List[FeeRecord] = []
-
-    for broker in brokers:
-        logger.debug("Processing broker: %s", broker.name)
+    return list(iter_scraped_fee_records(
+        brokers, force=force, timeout=timeout, pdf_text_dump_dir=pdf_text_dump_dir,
+        use_llm=use_llm, llm_model=llm_model, llm_cache_dir=llm_cache_dir,
+        llm_max_tokens=llm_max_tokens, llm_temperature=llm_temperature, strict_parse=strict_parse,
+        max_workers=max_workers, cache_dir=cache_dir, cache_ttl_seconds=cache_ttl_seconds,
+        use_playwright=use_playwright, llm_api_key_env=llm_api_key_env,
+    ))
 
-        for ds in broker.data_sources:
-            if not ds.url or (ds.allowed_to_scrape is False and not force):
-                continue
 
-            is_pdf = bool(getattr(ds, "type", "").lower() == "pdf") or getattr(ds, "url", "").lower().endswith('.pdf')
-            is_webpage = ds.type == "webpage" or (not is_pdf and ds.url.startswith('http'))
-
-            # Skip non-PDF, non-webpage sources
-            if not is_pdf and not is_webpage:
-                logger.info("Skipping unknown source type for %s: %s", broker.name, ds.url)
-                continue
-
-            logger.debug("Fetching %s for %s: %s", 'PDF' if is_pdf else 'webpage', broker.name, ds.url)
-
-            # Use Playwright for brokers that need JS rendering or bot-detection bypass
-            _playwright_brokers = {"Revolut", "Trade Republic"}
-            if broker.name in _playwright_brokers:
-                logger.info(f"Using Playwright for {broker.name} (JS rendering / bot detection bypass)...")
-                raw_bytes, fetch_error = _fetch_url_with_playwright(ds.url, timeout)
-            else:
-                raw_bytes, fetch_error = _fetch_url(ds.url, timeout=timeout)
-
-            if not raw_bytes:
-                logger.warning("No data fetched for %s from %s. Error: %s", broker.name, ds.url, fetch_error)
-                continue
-
-            # Handle PDF
-            if is_pdf and raw_bytes.startswith(b"%PDF"):
-                logger.debug("Processing PDF for %s (%d bytes)", broker.name, len(raw_bytes))
-                try:
-                    from pdfminer.high_level import extract_text
-                    from io import BytesIO
-                    text = extract_text(BytesIO(raw_bytes)) or ""
-
-                    if pdf_text_dump_dir and text.strip():
-                        pdf_text_dump_dir.mkdir(parents=True, exist_ok=True)
-                        safe_broker_name = re.sub(r'[\s/]+', '_', broker.name)
-                        safe_desc = re.sub(r'[\s/]+', '_', ds.description or 'document')
-                        url_hash = hashlib.md5(ds.url.encode()).hexdigest()[:8]
-                        text_filename = f"{safe_broker_name}_{safe_desc}_{url_hash}.txt"
-                        out_path = pdf_text_dump_dir / text_filename
-                        out_path.write_text(text, encoding="utf-8")
-                        logger.info("Saved extracted PDF text to %s", out_path)
-
-                    if use_llm and text.strip():
-                        llm_rows = extract_fee_records_via_llm(
-                            text, broker=broker.name, source_url=ds.url, model=llm_model,
-                            llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
-                            temperature=llm_temperature, strict_mode=strict_parse
-                        )
-                        all_records.extend(llm_rows)
-                        logger.info("LLM extracted %d records for %s.", len(llm_rows), broker.name)
-                    elif ds.use_llm and text.strip():
-                        # Check individual data source use_llm flag
-                        logger.info("Using LLM for data source with use_llm=True: %s", broker.name)
-                        llm_rows = extract_fee_records_via_llm(
-                            text, broker=broker.name, source_url=ds.url, model=llm_model,
-                            llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
-                            temperature=llm_temperature, strict_mode=strict_parse
-                        )
-                        all_records.extend(llm_rows)
-                        logger.info("LLM extracted %d records for %s via data source flag.", len(llm_rows), broker.name)
-
-                except Exception as exc:
-                    logger.error("PDF processing failed for %s", broker.name, exc_info=True)
-
-            # Handle Webpage (HTML) sources
-            elif is_webpage:
-                logger.debug("Processing webpage for %s", broker.name)
-                try:
-                    # Decode HTML and extract text
-                    try:
-                        html_str = raw_bytes.decode('utf-8', errors='ignore')
-                    except Exception:
-                        html_str = raw_bytes.decode('latin-1', errors='ignore')
-
-                    # Normalized safe names (always define these so linked-PDF handling can use them)
-                    safe_broker_name = re.sub(r'[\s/]+', '_', broker.name)
-                    safe_desc = re.sub(r'[\s/]+', '_', ds.description or 'document')
-
-                    # Save HTML content to text file (same as PDF)
-                    if pdf_text_dump_dir and html_str.strip():
-                        pdf_text_dump_dir.mkdir(parents=True, exist_ok=True)
-                        url_hash = hashlib.md5(ds.url.encode()).hexdigest()[:8]
-                        text_filename = f"{safe_broker_name}_{safe_desc}_{url_hash}.txt"
-                        out_path = pdf_text_dump_dir / text_filename
-                        out_path.write_text(html_str, encoding="utf-8")
-                        logger.info("Saved extracted webpage text to %s", out_path)
-
-                    # If the page contains links to PDFs, fetch and process those PDFs as well
-                    pdf_links = _extract_pdf_links_from_html(html_str, base_url=ds.url)
-                    if pdf_links:
-                        logger.info("Found %d PDF link(s) on page for %s; attempting to fetch them...", len(pdf_links), broker.name)
-                        for pl in pdf_links:
-                            try:
-                                pdf_bytes, pdf_err = _fetch_url(pl, timeout=timeout)
-                                if not pdf_bytes:
-                                    logger.warning("Failed to fetch linked PDF %s for %s: %s", pl, broker.name, pdf_err)
-                                    continue
-
-                                if pdf_bytes.startswith(b"%PDF"):
-                                    logger.info("Processing linked PDF %s for %s (%d bytes)", pl, broker.name, len(pdf_bytes))
-                                    try:
-                                        from pdfminer.high_level import extract_text
-                                        from io import BytesIO
-                                        linked_text = extract_text(BytesIO(pdf_bytes)) or ""
-
-                                        if pdf_text_dump_dir and linked_text.strip():
-                                            url_hash2 = hashlib.md5(pl.encode()).hexdigest()[:8]
-                                            linked_filename = f"{safe_broker_name}_{safe_desc}_{url_hash2}.txt"
-                                            linked_out = pdf_text_dump_dir / linked_filename
-                                            linked_out.write_text(linked_text, encoding="utf-8")
-                                            logger.info("Saved extracted linked PDF text to %s", linked_out)
-
-                                        # Extract fee records from linked PDF using LLM if requested
-                                        if use_llm and linked_text.strip():
-                                            llm_rows = extract_fee_records_via_llm(
-                                                linked_text, broker=broker.name, source_url=pl, model=llm_model,
-                                                llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
-                                                temperature=llm_temperature, strict_mode=strict_parse
-                                            )
-                                            all_records.extend(llm_rows)
-                                            logger.info("LLM extracted %d records from linked PDF for %s.", len(llm_rows), broker.name)
-                                        elif ds.use_llm and linked_text.strip():
-                                            llm_rows = extract_fee_records_via_llm(
-                                                linked_text, broker=broker.name, source_url=pl, model=llm_model,
-                                                llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
-                                                temperature=llm_temperature, strict_mode=strict_parse
-                                            )
-                                            all_records.extend(llm_rows)
-                                            logger.info("LLM extracted %d records from linked PDF for %s via ds.use_llm.", len(llm_rows), broker.name)
-
-                                    except Exception as exc:
-                                        logger.error("Linked PDF processing failed for %s (%s)", broker.name, pl, exc_info=True)
-                                else:
-                                    logger.warning("Linked resource is not a PDF (or invalid PDF header): %s", pl)
-                            except Exception as e:
-                                logger.exception("Error fetching/processing linked PDF %s for %s", pl, broker.name)
-
-                    # Use LLM to extract fee records from HTML content
-                    if use_llm and html_str.strip():
-                        logger.info("Using LLM to extract fees from webpage for %s", broker.name)
-                        llm_rows = extract_fee_records_via_llm(
-                            html_str, broker=broker.name, source_url=ds.url, model=llm_model,
-                            llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
-                            temperature=llm_temperature, strict_mode=strict_parse
-                        )
-                        all_records.extend(llm_rows)
-                        logger.info("LLM extracted %d records for %s from webpage.", len(llm_rows), broker.name)
-                    elif ds.use_llm and html_str.strip():
-                        # Check individual data source use_llm flag
-                        logger.info("Using LLM for webpage with use_llm=True: %s", broker.name)
-                        llm_rows = extract_fee_records_via_llm(
-                            html_str, broker=broker.name, source_url=ds.url, model=llm_model,
-                            llm_cache_dir=llm_cache_dir, max_output_tokens=llm_max_tokens,
-                            temperature=llm_temperature, strict_mode=strict_parse
-                        )
-                        all_records.extend(llm_rows)
-                        logger.info("LLM extracted %d records for %s from webpage via data source flag.", len(llm_rows), broker.name)
-                    else:
-                        logger.warning("Webpage source requires use_llm=True for %s", broker.name)
-
-                except Exception as exc:
-                    logger.error("Webpage processing failed for %s", broker.name, exc_info=True)
-            else:
-                logger.warning("Skipping non-PDF/non-webpage content for %s from %s.", broker.name, ds.url)
+def iter_scraped_fee_records(
+    brokers: List[Broker], *, force: bool = False, timeout: float = 10.0, pdf_text_dump_dir: Optional[Path] = None,
+    use_llm: bool = False, llm_model: str = "gpt-4o", llm_cache_dir: Optional[Path] = None,
+    llm_max_tokens: int = 1500, llm_temperature: float = 0.0, strict_parse: bool = False,
+    max_workers: int = SCRAPE_MAX_WORKERS, cache_dir: Optional[Path] = None, cache_ttl_seconds: int = 0,
+    use_playwright: bool = False, llm_api_key_env: Optional[str] = None,
+) -> Iterator[FeeRecord]:
+    """
+    Like :func:`scrape_fee_records`, but yields each unique record as soon as
+    its source has been processed instead of collecting them in a list.
+    """
+    logger.info("Starting scrape process for %d brokers...", len(brokers))
+    cache = SimpleCache(Path(cache_dir), cache_ttl_seconds) if cache_dir else None
+    seen = set()
+    found = 0
+
+    def _unseen(rows: List[FeeRecord]) -> Iterator[FeeRecord]:
+        nonlocal found
+        found += len(rows)
+        for row in rows:
+            if row not in seen:
+                seen.add(row)
+                yield row
+
+    # Each source is fetched and processed on its own worker thread (sharing
+    # the pooled session); map() yields the results in source order
+    sources = [
+        (broker, ds)
+        for broker in brokers
+        for ds in broker.data_sources
+        if ds.url and (ds.allowed_to_scrape is not False or force)
+    ]
+
+    def _process(source) -> List[FeeRecord]:
+        broker, ds = source
+        logger.debug("Processing %s source: %s", broker.name, ds.url)
+        return _scrape_source(
+            broker, ds, timeout=timeout, pdf_text_dump_dir=pdf_text_dump_dir, use_llm=use_llm,
+            llm_model=llm_model, llm_cache_dir=llm_cache_dir, llm_max_tokens=llm_max_tokens,
+            llm_temperature=llm_temperature, strict_parse=strict_parse, cache=cache,
+            use_playwright=use_playwright, llm_api_key_env=llm_api_key_env,
+        )
 
-    logger.info("Scrape finished. Found %d total records.", len(all_records))
-    unique_records = list(dict.fromkeys(all_records))
-    logger.info("Returning %d unique records.", len(unique_records))
-    return unique_records
+    if sources:
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(sources)))
+        try:
+            for records in executor.map(_process, sources):
+                yield from _unseen(records)
+        finally:
+            # A consumer that stops early (closing the generator) should not
+            # wait for, or keep fetching, the sources still queued
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    logger.info("Scrape finished. Found %d total records.", found)
+    logger.info("Returned %d unique records.", len(seen))
 
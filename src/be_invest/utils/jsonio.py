@@ -0,0 +1,38 @@
+"""
+JSON reading and writing that uses orjson when it is installed.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers handle
+parse errors the same way with either backend.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse a JSON document."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` as compact UTF-8 JSON (e.g. one JSONL line)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(obj: Any, path: Path) -> None:
+    """Write ``obj`` as indented UTF-8 JSON."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,94 @@
+"""
+OpenAI chat helpers shared by the summary scripts: a pooled client, an on-disk
+response cache and the structured-output schema for fee extraction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+try:
+    from openai import OpenAI
+except ImportError:
+    OpenAI = None
+
+logger = logging.getLogger(__name__)
+
+# Structured output for single-document extraction: the model is constrained
+# to this schema, so the response is always parseable JSON (strict mode needs
+# an object at the root, hence the "records" wrapper)
+FEE_RECORDS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "fee_records",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "records": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "instrument_type": {"type": "string"},
+                            "order_channel": {"type": "string"},
+                            "base_fee": {"type": ["number", "null"]},
+                            "variable_fee": {"type": ["string", "null"]},
+                        },
+                        "required": ["instrument_type", "order_channel", "base_fee", "variable_fee"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["records"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def get_client(api_key: str):
+    """Return one OpenAI client per key so all requests share its connection pool."""
+    return OpenAI(api_key=api_key)
+
+
+def create_completion(client, request: dict, cache_dir: Optional[Path] = None,
+                      refresh: bool = False) -> Optional[str]:
+    """Return the message content for a chat completion request.
+
+    With ``cache_dir`` set, responses are stored there as ``{sha256}.json``,
+    keyed by the whole request (model, messages and parameters), so a rerun on
+    unchanged text returns without calling the API. ``refresh`` skips the
+    lookup but still stores the new response. Refusals return None and are
+    not cached.
+    """
+    cache_path = None
+    if cache_dir is not None:
+        key = hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+        cache_path = Path(cache_dir) / f"{key}.json"
+        if not refresh and cache_path.exists():
+            logger.info(f"💾 Using cached response: {cache_path.name}")
+            return json.loads(cache_path.read_text(encoding="utf-8"))["content"]
+
+    response = client.chat.completions.create(**request)
+    message = response.choices[0].message
+    if message.content is None:
+        logger.error(f"❌ {request['model']} refused the request: {getattr(message, 'refusal', None)}")
+        return None
+
+    if cache_path is not None:
+        # Write via a temp file so concurrent requests never see a partial entry
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps({"model": request["model"], "content": message.content}, ensure_ascii=False),
+                            encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    return message.content
@@ -0,0 +1,92 @@
+"""Test that fallback-model escalation in generate_summary.py respects the token budget."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts" / "generate"))
+import generate_summary  # noqa: E402
+
+BUDGET_TOKENS = 50
+BUDGET_CHARS = BUDGET_TOKENS * generate_summary.CHARS_PER_TOKEN
+
+
+def _record(n):
+    return {"instrument_type": f"Type {n}", "order_channel": "Online Platform",
+            "base_fee": float(n), "variable_fee": None}
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    """Record every per-document extraction; only the fallback model finds the fees."""
+    calls = []
+
+    def fake_extract(text, broker_name, api_key, model="gpt-4o", llm_cache_dir=None):
+        calls.append((model, text))
+        record = _record(len(calls))
+        if model != "gpt-4o":
+            record["base_fee"] = None
+        return [dict(record, broker=broker_name)]
+
+    monkeypatch.setattr(generate_summary, "extract_fees_with_gpt4o", fake_extract)
+    return calls
+
+
+def _fallback_texts(calls):
+    return [text for model, text in calls if model == "gpt-4o"]
+
+
+def test_escalation_splits_text_into_budget_chunks(extractions):
+    """A long text is re-extracted chunk by chunk and the records merged."""
+    text = "\n".join(f"line {i} " + "x" * 30 for i in range(20))
+
+    records = generate_summary.escalate_extraction(
+        [_record(0)], text, "Bolero", "key", "gpt-4o", chunk_chars=BUDGET_CHARS)
+
+    fallback_texts = _fallback_texts(extractions)
+    assert len(fallback_texts) > 1
+    assert all(len(chunk) <= BUDGET_CHARS for chunk in fallback_texts)
+    assert "".join(fallback_texts) == text
+    assert len(records) == len(fallback_texts)
+
+
+def test_complete_records_are_not_escalated(extractions):
+    """Enough complete records from the primary model skip the fallback."""
+    records = [_record(n) for n in range(generate_summary.MIN_RECORDS)]
+
+    assert generate_summary.escalate_extraction(records, "text", "Bolero", "key", "gpt-4o") is records
+    assert extractions == []
+
+
+def _run_main(monkeypatch, tmp_path, *args):
+    text_dir = tmp_path / "pdf_text"
+    text_dir.mkdir()
+    (text_dir / "bolero.txt").write_text("\n".join("fee line " + "y" * 40 for _ in range(30)), encoding="utf-8")
+    monkeypatch.setenv("OPENAI_API_KEY", "key")
+    monkeypatch.setattr(sys, "argv", [
+        "generate_summary.py", "--pdf-text-dir", str(text_dir), "--output", str(tmp_path / "summary.md"),
+        "--no-cache", "--extract-only", *args,
+    ])
+    assert generate_summary.main() == 0
+
+
+def test_per_file_escalation_respects_token_budget(monkeypatch, tmp_path, extractions):
+    """Per-file extraction escalates split files in budget-sized chunks."""
+    _run_main(monkeypatch, tmp_path, "--per-file", "--token-budget", str(BUDGET_TOKENS))
+
+    fallback_texts = _fallback_texts(extractions)
+    assert len(fallback_texts) > 1
+    assert all(len(text) <= BUDGET_CHARS for model, text in extractions)
+
+
+def test_combined_escalation_respects_chunk_size(monkeypatch, tmp_path, extractions):
+    """The combined path escalates each broker in chunks as well."""
+    monkeypatch.setattr(generate_summary, "extract_fees_batch",
+                        lambda text_by_broker, *a, **kw: [dict(_record(0), broker=b) for b in text_by_broker])
+
+    _run_main(monkeypatch, tmp_path, "--chunk-tokens", str(BUDGET_TOKENS))
+
+    fallback_texts = _fallback_texts(extractions)
+    assert len(fallback_texts) > 1
+    assert all(len(text) <= BUDGET_CHARS for text in fallback_texts)
@@ -0,0 +1,172 @@
+"""Test conditional revalidation of cached scrape responses."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from be_invest.cache import SimpleCache
+from be_invest.models import Broker, DataSource, FeeRecord
+from be_invest.sources import scrape
+
+URL = "https://broker.example/tarifs.pdf"
+
+
+class _Response:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise scrape.HTTPError(f"{self.status_code} error", response=self)
+
+
+class _Session:
+    """Stands in for the shared requests session, replaying canned responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.calls.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    def install(*responses):
+        sess = _Session(*responses)
+        monkeypatch.setattr(scrape, "_get_session", lambda: sess)
+        return sess
+    return install
+
+
+def test_validators_stored_on_200(tmp_path, session):
+    """A 200 response is cached along with its ETag and Last-Modified."""
+    cache = SimpleCache(tmp_path)
+    session(_Response(200, b"%PDF-1", {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}))
+
+    data, error = scrape._fetch_url(URL, cache=cache)
+
+    assert (data, error) == (b"%PDF-1", None)
+    assert cache.get(URL) == b"%PDF-1"
+    meta = cache.metadata(URL)
+    assert meta["etag"] == '"v1"'
+    assert meta["last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+def test_304_reuses_cached_body(tmp_path, session):
+    """A 304 answer to the conditional request returns the cached body."""
+    cache = SimpleCache(tmp_path)
+    cache.put(URL, b"%PDF-1", {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    sess = session(_Response(304))
+
+    data, error = scrape._fetch_url(URL, cache=cache)
+
+    assert (data, error) == (b"%PDF-1", None)
+    assert sess.calls[0]["If-None-Match"] == '"v1"'
+    assert sess.calls[0]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+def test_304_without_cached_body_refetches(tmp_path, session):
+    """Validators without a stored body trigger an unconditional refetch."""
+    cache = SimpleCache(tmp_path)
+    cache.put(URL, b"%PDF-1", {"etag": '"v1"'})
+    data_path, _ = cache._paths(URL)
+    data_path.unlink()
+    sess = session(_Response(304), _Response(200, b"%PDF-2", {"ETag": '"v2"'}))
+
+    data, _ = scrape._fetch_url(URL, cache=cache)
+
+    assert data == b"%PDF-2"
+    assert len(sess.calls) == 2
+    assert "If-None-Match" not in sess.calls[1]
+    assert cache.metadata(URL)["etag"] == '"v2"'
+
+
+def test_ttl_zero_revalidates_every_time(tmp_path, session):
+    """With no TTL every fetch sends a conditional request."""
+    cache = SimpleCache(tmp_path, ttl_seconds=0)
+    sess = session(_Response(200, b"%PDF-1", {"ETag": '"v1"'}), _Response(304), _Response(304))
+
+    for _ in range(3):
+        data, _ = scrape._fetch_url(URL, cache=cache)
+        assert data == b"%PDF-1"
+
+    assert len(sess.calls) == 3
+    assert "If-None-Match" not in sess.calls[0]
+    assert all(call["If-None-Match"] == '"v1"' for call in sess.calls[1:])
+
+
+def test_fresh_entry_skips_request(tmp_path, session):
+    """An entry within its TTL is returned without contacting the server."""
+    cache = SimpleCache(tmp_path, ttl_seconds=3600)
+    cache.put(URL, b"%PDF-1", {"etag": '"v1"'})
+    sess = session()
+
+    data, _ = scrape._fetch_url(URL, cache=cache)
+
+    assert data == b"%PDF-1"
+    assert sess.calls == []
+
+
+def test_simple_cache_freshness_and_touch(tmp_path):
+    """is_fresh/touch follow the TTL; get(allow_stale=True) ignores it."""
+    cache = SimpleCache(tmp_path, ttl_seconds=60)
+    assert not cache.is_fresh(URL)
+    assert cache.metadata(URL) is None
+
+    cache.put(URL, b"body", {"etag": '"v1"'})
+    assert cache.is_fresh(URL)
+
+    # Age the entry past its TTL
+    _, meta_path = cache._paths(URL)
+    meta = cache.metadata(URL)
+    meta["timestamp"] = time.time() - 120
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    assert not cache.is_fresh(URL)
+    assert cache.get(URL) is None
+    assert cache.get(URL, allow_stale=True) == b"body"
+
+    cache.touch(URL)
+    assert cache.is_fresh(URL)
+    assert cache.get(URL) == b"body"
+    assert cache.metadata(URL)["etag"] == '"v1"'
+
+
+def test_simple_cache_without_ttl_is_never_fresh(tmp_path):
+    """A TTL of 0 never skips revalidation, though get() still returns the body."""
+    cache = SimpleCache(tmp_path, ttl_seconds=0)
+    cache.put(URL, b"body")
+    assert not cache.is_fresh(URL)
+    assert cache.get(URL) == b"body"
+
+
+def test_closing_scrape_generator_does_not_wait_for_sources(monkeypatch):
+    """Stopping after the first record neither waits for in-flight nor starts queued sources."""
+    release = threading.Event()
+    scraped = []
+
+    def fake_scrape(broker, ds, **kwargs):
+        scraped.append(ds.url)
+        if len(scraped) > 1:
+            release.wait(5)
+        return [FeeRecord(broker.name, "Stocks", "Online Platform", 1.0, None, "EUR", ds.url)]
+
+    monkeypatch.setattr(scrape, "_scrape_source", fake_scrape)
+    sources = [DataSource("pdf", "Tariffs", url=f"{URL}?page={i}", allowed_to_scrape=True) for i in range(10)]
+    records = scrape.iter_scraped_fee_records([Broker("Bolero", "bolero.be", "BE", ["Stocks"], sources)],
+                                              max_workers=2)
+
+    next(records)
+    start = time.monotonic()
+    records.close()
+    elapsed = time.monotonic() - start
+    release.set()
+
+    assert elapsed < 1
+    assert len(scraped) <= 3